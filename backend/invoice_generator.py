@@ -2,7 +2,7 @@
 Invoice Generator Script
 
 Usage:
-    invoice_generator.py [-v] [-V] [--pdf] [--pdf-backend=<backend>] <yaml_file>
+    invoice_generator.py [-v] [-V] [--pdf] [--pdf-backend=<backend>] [--no-persistent-soffice] [--force] <yaml_file>...
     invoice_generator.py -h
 
 Options:
@@ -11,7 +11,10 @@ Options:
     -V --version    Show version information
     --pdf           Generate PDF output in addition to DOCX
     --pdf-backend=<backend>  PDF backend: 'libreoffice' (default) or 'docx2pdf'
-    <yaml_file>     Name of YAML configuration file (will be loaded from invoices directory)
+    --no-persistent-soffice  Run a one-shot soffice per conversion instead of a shared listener
+    --force         Regenerate even if the output is newer than the YAML file and images
+    <yaml_file>     Name of YAML configuration file(s) (will be loaded from invoices directory);
+                    several files are generated in parallel
 
 This script generates an invoice document using data from a YAML file.
 
@@ -20,17 +23,23 @@ Installation Instructions:
 2. Install the required libraries using pip:
    - python-docx: `pip install python-docx`
    - PyYAML: `pip install PyYAML`
+     For fast YAML parsing, build PyYAML against libyaml so CSafeLoader is available:
+     `brew install libyaml` then `pip install --no-binary=:all: pyyaml`
    - docopt: `pip install docopt`
 3. For PDF conversion (if using --pdf flag):
    - Install LibreOffice: `brew install libreoffice`
-   - Install unoconv: `brew install unoconv`
+     (the `soffice` binary must be on your PATH)
+   - Optionally install unoconv (`brew install unoconv`) so conversions can reuse
+     a single long-lived LibreOffice listener instead of starting one per document
 
 Instructions:
 - Place the 'DioramaConsultingIcon.png' image in the same directory as this script.
 - Place your YAML configuration files in the 'invoices' directory.
 - Run the script: python invoice_generator.py client1.yaml
 - Add --pdf flag to generate PDF output: python invoice_generator.py --pdf client1.yaml
+- Pass several files to generate them in parallel: python invoice_generator.py client1.yaml client2.yaml
 - Generated invoices will be saved in the 'invoices' directory
+- Invoices that are already newer than their YAML file and images are not rebuilt; use --force to regenerate
 - Use -v for detailed logging output
 
 Invoice Calculation Logic:
@@ -52,49 +61,123 @@ Invoice Calculation Logic:
 Note: All monetary values are formatted to 2 decimal places in the output.
 """
 
+import copy
+import io
+import json
 import logging
-from docx import Document # type: ignore
-from docx.shared import Inches, Pt # type: ignore
-from docx.enum.text import WD_ALIGN_PARAGRAPH # type: ignore
-from docx.oxml.ns import qn # type: ignore
-from docx.oxml import OxmlElement # type: ignore
+import math
 import os
+import shutil
 import subprocess
 from datetime import date, datetime
-from docx.enum.text import WD_COLOR_INDEX # type: ignore
 import yaml # type: ignore
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one if unavailable
+try:
+    from yaml import CSafeLoader as _Loader # type: ignore
+except ImportError:
+    from yaml import SafeLoader as _Loader # type: ignore
+
 INVOICES_DIR = 'invoices'
 
+# PAID stamp image shipped alongside this script, resolved once at import
+_STAMP_PATH = Path(__file__).resolve().parent / 'paid_stamp.png'
+_STAMP_EXISTS = _STAMP_PATH.is_file()
+
+# Hours anywhere in a service entry, e.g. "AI Consultancy (1.5 hours)" -> "1.5".
+# A '.' must be followed by digits, so "(2. hours)" is not an hours count
+_HOURS_RE = re.compile(r'\((\d+(?:\.\d+)?)\s*hours?\)')
+
+# Namespaced OOXML attribute names used for cell shading (equivalent to qn('w:...'),
+# spelled out so python-docx is only imported when a document is actually built)
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_QN_FILL = _W_NS + 'fill'
+_QN_VAL = _W_NS + 'val'
+
+# Footer text, rendered per invoice from the loaded details
+_FOOTER_TEMPLATE = (
+    "Payment terms of within {payment_terms_days} days.\n"
+    "Please make payment by direct transfer to:\n"
+    "Bank Address: {bank_address}\n"
+    "Account name: {company_name}\n"
+    "Account Number: {account_number}\n"
+    "Sort Code: {sort_code}\n"
+    "\n"
+    "Thanks for your business!\n"
+    "\n"
+    "{company_name}, Registered in the UK. Company Number: {company_number}\n"
+    "Registered office: {registered_address}\n"
+    "Registered for VAT in the UK. Registration number: {vat_number}\n"
+    "Email: {email} | Contact: {contact_number}"
+)
+
+# Deflate level for saved DOCX files; level 1 is several times faster than
+# zipfile's default of 6 and the invoice XML still compresses well
+DOCX_COMPRESSLEVEL = 1
+
+# UNO connection string for the shared headless LibreOffice listener
+SOFFICE_LISTENER = 'socket,host=127.0.0.1,port=2202;urp;'
+
 __version__ = '1.0.0'
 
+_log = logging.getLogger(__name__)
+# Handler added by setup_logging when nothing else configured logging
+_log_handler = None
+
+_invoices_dir = None
+_soffice_proc = None
+# False in batch worker processes, which only connect to the parent's listener
+_soffice_owner = True
+
+class _BlankMissing(dict):
+    """Mapping for str.format_map that renders missing keys as empty strings."""
+    def __missing__(self, key):
+        return ''
+
 def setup_logging(verbose):
-    """Configure logging based on verbose flag."""
+    """
+    Configure logging based on verbose flag.
+    Records propagate to the root logger, so an application that imports this
+    module keeps its own handlers; a stderr handler is only added when the root
+    logger has none, as when run as the CLI. Safe to call repeatedly (e.g. once
+    per worker process): that handler is reconfigured rather than duplicated.
+    """
+    global _log_handler
     if verbose:
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+        formatter = logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
     else:
-        logging.basicConfig(level=logging.WARNING)
+        formatter = logging.Formatter(logging.BASIC_FORMAT)
+    _log.setLevel(logging.INFO if verbose else logging.WARNING)
+    root = logging.getLogger()
+    if _log_handler is None and not root.handlers:
+        _log_handler = logging.StreamHandler()
+        root.addHandler(_log_handler)
+    if _log_handler is not None:
+        _log_handler.setFormatter(formatter)
 
 def ensure_invoices_directory():
-    """Ensure the invoices directory exists."""
-    invoices_dir = Path(INVOICES_DIR)
-    invoices_dir.mkdir(exist_ok=True)
-    return invoices_dir
+    """Ensure the invoices directory exists, creating it at most once per process."""
+    global _invoices_dir
+    if _invoices_dir is None:
+        invoices_dir = Path(INVOICES_DIR)
+        invoices_dir.mkdir(exist_ok=True)
+        _invoices_dir = invoices_dir
+    return _invoices_dir
 
 def get_yaml_path(yaml_filename):
-    """Get the full path for a YAML file in the invoices directory."""
-    invoices_dir = ensure_invoices_directory()
-    yaml_path = invoices_dir / yaml_filename
-    if not yaml_path.exists():
-        raise FileNotFoundError(f"YAML file not found in invoices directory: {yaml_path}")
-    return yaml_path
+    """
+    Get the full path for a YAML file in the invoices directory.
+    Existence is not checked here; loading a missing file raises FileNotFoundError.
+    """
+    return ensure_invoices_directory() / yaml_filename
 
 def validate_yaml_path(yaml_path):
     """Validate that the YAML file exists."""
@@ -111,9 +194,81 @@ def get_pdf_path(docx_path):
     """Generate PDF path from DOCX path."""
     return docx_path.with_suffix('.pdf')
 
-def convert_to_pdf(docx_path: Path, logger, backend: str = 'libreoffice') -> Path:
+def get_asset_paths(details):
+    """Get the image files an invoice is built from."""
+    asset_paths = [Path(details['icon_name'])]
+    if details.get('paid'):
+        asset_paths.append(_STAMP_PATH)
+    return asset_paths
+
+def is_up_to_date(target_path, *input_paths):
+    """Return True if target_path exists and is no older than any existing input path."""
+    if not target_path.exists():
+        return False
+    target_mtime = target_path.stat().st_mtime
+    return all(target_mtime >= path.stat().st_mtime for path in input_paths if path.exists())
+
+def get_cache_path(yaml_path):
+    """Generate the JSON sidecar cache path for a YAML file."""
+    return yaml_path.with_suffix('.yaml.json')
+
+def write_details_cache(cache_path, details, logger):
+    """Atomically write parsed YAML details to the JSON sidecar cache."""
+    tmp_path = cache_path.with_suffix('.json.tmp')
+    try:
+        with open(tmp_path, 'w') as file:
+            # Dates and other non-JSON scalars are coerced to strings
+            json.dump(details, file, default=str)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Could not write YAML cache %s: %s", cache_path, e)
+
+def start_soffice_listener(soffice, logger):
+    """
+    Start the shared headless LibreOffice listener unless it is already running.
+    Batch worker processes never start one: they connect to the parent's listener.
+    """
+    global _soffice_proc
+    if not _soffice_owner:
+        return None
+    if _soffice_proc is None or _soffice_proc.poll() is not None:
+        logger.info("Starting persistent LibreOffice listener: %s", SOFFICE_LISTENER)
+        _soffice_proc = subprocess.Popen(
+            [
+                soffice,
+                '--headless',
+                f'--accept={SOFFICE_LISTENER}',
+                '--norestore',
+                '--nologo',
+                '--nodefault'
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    return _soffice_proc
+
+def stop_soffice_listener():
+    """Terminate the shared LibreOffice listener if this process started one."""
+    global _soffice_proc
+    if _soffice_proc is not None and _soffice_proc.poll() is None:
+        _soffice_proc.terminate()
+        try:
+            _soffice_proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            _soffice_proc.kill()
+    _soffice_proc = None
+
+def _init_batch_worker(verbose):
+    """ProcessPoolExecutor initializer: set up logging and share the parent's listener."""
+    global _soffice_owner
+    _soffice_owner = False
+    setup_logging(verbose)
+
+def convert_to_pdf(docx_path: Path, logger, backend: str = 'libreoffice', persistent: bool = False) -> Path:
     """
     Convert a DOCX file to PDF format using the selected backend.
+    With persistent=True (and unoconv installed) conversions are sent to a shared
+    LibreOffice listener, so its startup cost is paid once per process.
     Falls back to 'docx2pdf' if 'libreoffice' fails.
     """
     def try_docx2pdf_fallback() -> Path:
@@ -135,30 +290,48 @@ def convert_to_pdf(docx_path: Path, logger, backend: str = 'libreoffice') -> Pat
 
     if backend == 'libreoffice':
         try:
-            subprocess.run(['which', 'unoconv'], check=True, capture_output=True)
+            soffice = shutil.which('soffice') or shutil.which('libreoffice')
+            if soffice is None:
+                raise FileNotFoundError('soffice/libreoffice not found on PATH')
 
             pdf_path = get_pdf_path(docx_path)
-            logger.info(f"Converting DOCX to PDF using LibreOffice/unoconv: {pdf_path}")
+            logger.info("Converting DOCX to PDF using LibreOffice: %s", pdf_path)
 
-            result = subprocess.run(
-                [
+            if persistent and shutil.which('unoconv'):
+                start_soffice_listener(soffice, logger)
+                command = [
                     'unoconv',
+                    '--connection', f'{SOFFICE_LISTENER}StarOffice.ComponentContext',
                     '-f', 'pdf',
+                    '-o', str(pdf_path),
                     str(docx_path)
-                ],
+                ]
+            else:
+                command = [
+                    soffice,
+                    '--headless',
+                    '--convert-to', 'pdf',
+                    '--outdir', str(docx_path.parent),
+                    str(docx_path)
+                ]
+            converter = Path(command[0]).name
+
+            result = subprocess.run(
+                command,
                 capture_output=True,
-                text=True
+                text=True,
+                check=False
             )
 
             if result.returncode != 0:
-                logger.error(f"unoconv failed with exit code {result.returncode}")
-                logger.error(f"unoconv stdout:\n{result.stdout}")
-                logger.error(f"unoconv stderr:\n{result.stderr}")
-                raise RuntimeError(f"unoconv failed with exit code {result.returncode}")
+                logger.error("%s failed with exit code %s", converter, result.returncode)
+                logger.error("%s stdout:\n%s", converter, result.stdout)
+                logger.error("%s stderr:\n%s", converter, result.stderr)
+                raise RuntimeError(f"{converter} failed with exit code {result.returncode}")
 
             if not pdf_path.exists():
-                logger.error(f"unoconv ran but did not create output.\nstdout:\n{result.stdout}\nstderr:\n{result.stderr}")
-                raise RuntimeError(f"unoconv ran but did not create output.\nstdout:\n{result.stdout}\nstderr:\n{result.stderr}")
+                logger.error("%s ran but did not create output.\nstdout:\n%s\nstderr:\n%s", converter, result.stdout, result.stderr)
+                raise RuntimeError(f"{converter} ran but did not create output.\nstdout:\n{result.stdout}\nstderr:\n{result.stderr}")
 
             logger.info("PDF conversion completed successfully (LibreOffice)")
             return pdf_path
@@ -233,54 +406,367 @@ def convert_to_pdf(docx_path: Path, logger, backend: str = 'libreoffice') -> Pat
         raise RuntimeError(error_msg)
 '''
 
+def make_shading(color):
+    """Build a w:shd cell shading element with the given fill color."""
+    from docx.oxml import OxmlElement # type: ignore
+
+    shd = OxmlElement('w:shd')
+    shd.set(_QN_FILL, color)
+    shd.set(_QN_VAL, 'clear')
+    return shd
+
+def append_table_rows(table, rows):
+    """
+    Append body rows to a python-docx table by building the OOXML directly.
+    Each row is a sequence of (text, alignment) cells, where alignment is an
+    OOXML justification value such as 'right' or None for the default.
+    This skips table.add_row(), which re-walks the table XML for every row.
+    """
+    from docx.oxml import OxmlElement # type: ignore
+    from docx.oxml.ns import qn # type: ignore
+    from lxml import etree # type: ignore
+
+    tbl = table._tbl
+    widths = [gridCol.w for gridCol in tbl.tblGrid.gridCol_lst]
+    new_rows = []
+    for cells in rows:
+        tr = OxmlElement('w:tr')
+        for width, (text, alignment) in zip(widths, cells):
+            tc = etree.SubElement(tr, qn('w:tc'))
+            if width is not None:
+                tcW = etree.SubElement(etree.SubElement(tc, qn('w:tcPr')), qn('w:tcW'))
+                tcW.set(qn('w:w'), str(width.twips))
+                tcW.set(qn('w:type'), 'dxa')
+            p = etree.SubElement(tc, qn('w:p'))
+            if alignment:
+                etree.SubElement(etree.SubElement(p, qn('w:pPr')), qn('w:jc')).set(qn('w:val'), alignment)
+            if text:
+                t = etree.SubElement(etree.SubElement(p, qn('w:r')), qn('w:t'))
+                t.text = text
+                if text != text.strip():
+                    t.set('{http://www.w3.org/XML/1998/namespace}space', 'preserve')
+        new_rows.append(tr)
+    tbl.extend(new_rows)
+
+def save_docx(doc, output_path):
+    """Save a python-docx Document, writing the zip with DOCX_COMPRESSLEVEL."""
+    from docx.opc import phys_pkg # type: ignore
+
+    # python-docx does not expose the deflate level, so wrap the ZipFile it uses once
+    if not isinstance(phys_pkg.ZipFile, partial):
+        phys_pkg.ZipFile = partial(phys_pkg.ZipFile, compresslevel=DOCX_COMPRESSLEVEL)
+    doc.save(output_path)
+
+def parse_service_hours(service):
+    """
+    Get the hours billed for a service entry,
+    e.g. "AI Consultancy (1 hour)" -> 1.0.
+    The hours may appear anywhere in the entry; entries without them count as 0 hours.
+    """
+    match = _HOURS_RE.search(service)
+    return float(match.group(1)) if match else 0.0
+
 def load_details(file_path):
     """Load and validate configuration from YAML file."""
-    logger = logging.getLogger(__name__)
-    logger.info(f"Loading configuration from {file_path}")
+    _log.info("Loading configuration from %s", file_path)
     try:
-        with open(file_path, 'r') as file:
-            details = yaml.safe_load(file)
+        file_path = Path(file_path)
+        cache_path = get_cache_path(file_path)
+        # Reuse the JSON sidecar unless the YAML has been modified since it was written
+        if cache_path.exists() and cache_path.stat().st_mtime >= file_path.stat().st_mtime:
+            _log.info("Using cached configuration from %s", cache_path)
+            with open(cache_path, 'r') as file:
+                details = json.load(file)
+        else:
+            # Hand libyaml the raw bytes so UTF-8 decoding happens in C
+            details = yaml.load(file_path.read_bytes(), Loader=_Loader)
+            write_details_cache(cache_path, details, _log)
             
         # Log all the values from YAML only if in verbose mode
-        if logger.isEnabledFor(logging.INFO):
-            logger.info("Successfully loaded YAML configuration:")
-            logger.info(f"Company Name: {details.get('company_name')}")
-            logger.info(f"Invoice Number: {details.get('invoice_number')}")
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("Successfully loaded YAML configuration:")
+            _log.info("Company Name: %s", details.get('company_name'))
+            _log.info("Invoice Number: %s", details.get('invoice_number'))
             if 'invoice_date' in details:
-                logger.info(f"Invoice Date: {details.get('invoice_date')}")
-            logger.info(f"Client Name: {details.get('client_name')}")
-            logger.info(f"Client Address: {details.get('client_address')}")
-            logger.info(f"Services: {details.get('services')}")
-            logger.info(f"Hourly Rate: £{details.get('hourly_rate')}")
-            logger.info(f"VAT Rate: {details.get('vat_rate')}%")
-            logger.info(f"Payment Terms: {details.get('payment_terms_days')} days")
-            logger.info(f"Bank Details:")
-            logger.info(f"  - Account Number: {details.get('account_number')}")
-            logger.info(f"  - Sort Code: {details.get('sort_code')}")
-            logger.info(f"  - Bank Address: {details.get('bank_address')}")
-            logger.info(f"Company Details:")
-            logger.info(f"  - Company Number: {details.get('company_number')}")
-            logger.info(f"  - VAT Number: {details.get('vat_number')}")
-            logger.info(f"  - Registered Address: {details.get('registered_address')}")
-            logger.info(f"Contact Details:")
-            logger.info(f"  - Email: {details.get('email')}")
-            logger.info(f"  - Phone: {details.get('contact_number')}")
-            logger.info(f"Document Settings:")
-            logger.info(f"  - Font Name: {details.get('font_name')}")
-            logger.info(f"  - Icon Name: {details.get('icon_name')}")
-            logger.info(f"  - Column Widths: {details.get('column_widths')}")
+                _log.info("Invoice Date: %s", details.get('invoice_date'))
+            _log.info("Client Name: %s", details.get('client_name'))
+            _log.info("Client Address: %s", details.get('client_address'))
+            _log.info("Services: %s", details.get('services'))
+            _log.info("Hourly Rate: £%s", details.get('hourly_rate'))
+            _log.info("VAT Rate: %s%%", details.get('vat_rate'))
+            _log.info("Payment Terms: %s days", details.get('payment_terms_days'))
+            _log.info("Bank Details:")
+            _log.info("  - Account Number: %s", details.get('account_number'))
+            _log.info("  - Sort Code: %s", details.get('sort_code'))
+            _log.info("  - Bank Address: %s", details.get('bank_address'))
+            _log.info("Company Details:")
+            _log.info("  - Company Number: %s", details.get('company_number'))
+            _log.info("  - VAT Number: %s", details.get('vat_number'))
+            _log.info("  - Registered Address: %s", details.get('registered_address'))
+            _log.info("Contact Details:")
+            _log.info("  - Email: %s", details.get('email'))
+            _log.info("  - Phone: %s", details.get('contact_number'))
+            _log.info("Document Settings:")
+            _log.info("  - Font Name: %s", details.get('font_name'))
+            _log.info("  - Icon Name: %s", details.get('icon_name'))
+            _log.info("  - Column Widths: %s", details.get('column_widths'))
         
         return details
     except FileNotFoundError:
-        logger.error(f"Configuration file {file_path} not found")
+        _log.error("Configuration file %s not found", file_path)
         raise
     except yaml.YAMLError as e:
-        logger.error(f"Error parsing YAML file: {e}")
+        _log.error("Error parsing YAML file: %s", e)
+        raise
+    except json.JSONDecodeError as e:
+        _log.error("Error parsing YAML cache file: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error loading configuration: {e}")
+        _log.error("Unexpected error loading configuration: %s", e)
         raise
 
+@lru_cache(maxsize=None)
+def get_docx_template():
+    """
+    Build the parts of the invoice document that do not depend on the details
+    (default font size, table layout and styles, headings, header row shading)
+    once per process and return them as DOCX bytes.
+    """
+    from docx import Document # type: ignore
+    from docx.shared import Pt # type: ignore
+    from docx.enum.text import WD_ALIGN_PARAGRAPH # type: ignore
+
+    doc = Document()
+    doc.styles['Normal'].font.size = Pt(12)
+
+    # Header table for the icon and invoice/client details
+    table = doc.add_table(rows=1, cols=2)
+    table.autofit = False
+
+    doc.add_paragraph()  # space
+
+    # Table for services, with a shaded header row
+    doc.add_paragraph("Invoice Details", style='Heading 2')
+
+    table = doc.add_table(rows=1, cols=2)
+    table.style = 'Table Grid'
+    hdr_cells = table.rows[0].cells
+    hdr_cells[0].text = 'Description of Service'
+    hdr_cells[1].text = 'Total'
+    hdr_cells[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
+
+    # Add background color to header cells
+    light_green_color = "A9D08E"
+    shd_template = make_shading(light_green_color)
+    for cell in hdr_cells:
+        tcPr = cell._tc.get_or_add_tcPr()
+        tcPr.append(copy.deepcopy(shd_template))
+
+    doc.add_paragraph()  # space
+
+    # Footer details paragraph, filled in per invoice
+    doc.add_paragraph().add_run().font.size = Pt(8)
+
+    buffer = io.BytesIO()
+    save_docx(doc, buffer)
+    return buffer.getvalue()
+
+def build_docx(details, output_path):
+    """Build the invoice document from loaded details and save it to output_path."""
+    # python-docx is slow to import, so only pay for it when building a document
+    from docx import Document # type: ignore
+    from docx.shared import Inches, Pt # type: ignore
+    from docx.enum.text import WD_ALIGN_PARAGRAPH # type: ignore
+
+    # Start from the prebuilt template and only fill in invoice-specific content
+    doc = Document(io.BytesIO(get_docx_template()))
+    
+    # Set default font
+    doc.styles['Normal'].font.name = details['font_name']
+
+    # Header with icon placeholder and invoice/client details
+    header_table, table = doc.tables
+    header_table.columns[0].width = Inches(details['column_widths'][0])
+    header_table.columns[1].width = Inches(details['column_widths'][1])
+
+    # Left cell - Company Icon Placeholder
+    cell_left = header_table.cell(0, 0)
+    # Add image - ensure the icon is in the same directory or provide full path
+    cell_left.paragraphs[0].add_run().add_picture(details['icon_name'], width=Inches(2.0))
+
+    # Right cell - Invoice Number and Client Info (placeholders)
+    cell_right = header_table.cell(0, 1)
+
+    # Add Company Name Heading
+    p_company_name = cell_right.paragraphs[0] # Use the first paragraph for the company name
+    p_company_name.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    run_company_name = p_company_name.add_run(details['company_name'])
+    run_company_name.bold = True
+    run_company_name.font.size = Pt(16)
+
+    # Get date - either from YAML or today's date
+    try:
+        if 'invoice_date' in details:
+            # Try to parse the date from YAML
+            parsed_date = datetime.strptime(details['invoice_date'], '%d.%m.%y')
+            today_date_str = parsed_date.strftime('%d.%m.%y')
+            _log.info("Using date from YAML file: %s", today_date_str)
+        else:
+            today_date_str = date.today().strftime('%d.%m.%y')
+            _log.info("Using today's date: %s", today_date_str)
+    except (ValueError, TypeError):
+        # If date parsing fails, use today's date
+        today_date_str = date.today().strftime('%d.%m.%y')
+        _log.warning("Failed to parse date from YAML, using today's date: %s", today_date_str)
+
+    # Add Invoice details in a new paragraph below the company name
+    p_invoice_details = cell_right.add_paragraph() # Add a new paragraph for the rest
+    p_invoice_details.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    # Clear existing content before adding runs
+    p_invoice_details.text = '' 
+
+    # Add runs piece by piece to apply highlighting and formatting
+    run = p_invoice_details.add_run("Invoice #: ")
+    run.bold = True
+    run = p_invoice_details.add_run(str(details['invoice_number']))
+    run.bold = True
+
+    run = p_invoice_details.add_run(f"\nDate: {today_date_str}\n\n")
+    run.bold = True
+
+    run = p_invoice_details.add_run(details['client_name'])
+    run.bold = True
+
+    run = p_invoice_details.add_run("\n") # Keep the newline separate
+    run = p_invoice_details.add_run(details['client_address'])
+    run.bold = True
+
+    # Calculate service costs up front, before touching the document
+    _log.info("Processing services and calculating costs:")
+    rows = []
+    for service in details['services']:
+        hours = parse_service_hours(service)
+        cost = hours * details['hourly_rate']
+        rows.append((service, hours, cost))
+        _log.info("Service: %s - Hours: %s - Cost: £%.2f", service, hours, cost)
+    # fsum avoids accumulating float rounding error across many rows
+    subtotal = math.fsum(cost for *_, cost in rows)
+
+    # Service rows, appended to the table XML in a single batch
+    append_table_rows(table, [
+        [(service, None), (f'£{cost:.2f}', 'right')]
+        for service, hours, cost in rows
+    ])
+
+    _log.info("Subtotal calculated: £%.2f", subtotal)
+
+    # Totals
+    row_subtotal = table.add_row().cells
+    row_subtotal[0].text = 'Subtotal'
+    row_subtotal[1].text = f'£{subtotal:.2f}'
+    row_subtotal[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
+
+    vat_amount = subtotal * (details['vat_rate'] / 100)
+    _log.info("VAT amount calculated (%s%%): £%.2f", details['vat_rate'], vat_amount)
+
+    row_vat = table.add_row().cells
+    row_vat[0].text = f'VAT ({details["vat_rate"]}%)'
+    row_vat[1].text = f'£{vat_amount:.2f}'
+    row_vat[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
+
+    total = subtotal + vat_amount
+    _log.info("Total amount due: £%.2f", total)
+
+    row_total = table.add_row().cells
+    # Make both cells of Total Amount Due bold
+    total_due_cell = row_total[0]
+    total_due_cell.text = '' # Clear existing content
+    total_due_run = total_due_cell.paragraphs[0].add_run('Total Amount Due')
+    total_due_run.bold = True
+
+    # Make the amount bold too
+    total_amount_cell = row_total[1]
+    total_amount_cell.text = '' # Clear existing content
+    total_amount_run = total_amount_cell.paragraphs[0].add_run(f'£{total:.2f}')
+    total_amount_run.bold = True
+    total_amount_cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
+
+    # Footer details
+    footer_text = _FOOTER_TEMPLATE.format_map(_BlankMissing(details))
+    doc.paragraphs[-1].runs[0].text = footer_text
+
+    # Add PAID stamp as a watermark in the footer, bottom left, if paid
+    if details.get('paid'):
+        try:
+            if _STAMP_EXISTS:
+                section = doc.sections[0]
+                footer = section.footer
+                # Add a new paragraph for the paid stamp image
+                paragraph = footer.add_paragraph()
+                run = paragraph.add_run()
+                run.add_picture(str(_STAMP_PATH), width=Inches(1.5))
+                paragraph.paragraph_format.space_after = 0
+                paragraph.paragraph_format.space_before = 0
+            else:
+                _log.warning("PAID stamp image not found at %s", _STAMP_PATH)
+        except Exception as e:
+            _log.error("Failed to add PAID watermark to footer: %s", e)
+
+    # Save the document with the new output path
+    _log.info("Saving invoice document to: %s", output_path)
+    save_docx(doc, output_path)
+
+def generate_invoice(yaml_filename, pdf=False, backend='libreoffice', persistent=False, force=False):
+    """
+    Generate an invoice from a YAML file in the invoices directory.
+    Unless force=True, generation is skipped when the existing output is newer
+    than the YAML file and the images it references.
+    Returns the path of the generated document (the PDF if pdf=True).
+    """
+    # Ensure invoices directory exists and get YAML path
+    yaml_path = get_yaml_path(yaml_filename)
+    
+    # Get the output path based on input filename
+    output_path = get_output_path(yaml_path)
+    target_path = get_pdf_path(output_path) if pdf else output_path
+
+    # Only load the details (from the JSON cache) once the YAML is known to be older
+    details = None
+    if not force and is_up_to_date(target_path, yaml_path):
+        details = load_details(yaml_path)
+        if is_up_to_date(target_path, *get_asset_paths(details)):
+            _log.info("%s is up to date, skipping generation", target_path)
+            return target_path
+    
+    # Load details from specified YAML file
+    if details is None:
+        details = load_details(yaml_path)
+    _log.info("Starting invoice generation...")
+
+    build_docx(details, output_path)
+
+    # Convert to PDF if requested
+    if pdf:
+        pdf_path = convert_to_pdf(output_path, _log, backend=backend, persistent=persistent)
+        # Open the PDF instead of DOCX if it was generated
+        output_path = pdf_path
+
+    return output_path
+
+def open_document(output_path, logger):
+    """Open a generated document with the platform's default viewer."""
+    try:
+        logger.info("Attempting to open the document: %s", output_path)
+        if sys.platform == 'darwin':
+            subprocess.Popen(['open', str(output_path)])
+        elif sys.platform == 'win32':
+            os.startfile(str(output_path))
+        else:
+            subprocess.Popen(['xdg-open', str(output_path)])
+        logger.info("Document opened successfully")
+    except Exception as e:
+        logger.error("Could not automatically open the file. Error: %s", e)
+
 def main():
     from docopt import docopt # type: ignore
 
@@ -290,238 +776,43 @@ def main():
     # Setup logging based on verbose flag
     setup_logging(arguments['--verbose'])
     
-    logger = logging.getLogger(__name__)
+    yaml_files = arguments['<yaml_file>']
+    options = dict(
+        pdf=arguments['--pdf'],
+        backend=arguments.get('--pdf-backend') or 'libreoffice',
+        persistent=not arguments['--no-persistent-soffice'],
+        force=arguments['--force']
+    )
     
     try:
-        # Ensure invoices directory exists and get YAML path
-        yaml_path = get_yaml_path(arguments['<yaml_file>'])
-        
-        # Get the output path based on input filename
-        output_path = get_output_path(yaml_path)
-        
-        # Load details from specified YAML file
-        details = load_details(yaml_path)
-        logger.info("Starting invoice generation...")
-        
-        # Create and configure document
-        doc = Document()
-        
-        # Set default font
-        style = doc.styles['Normal']
-        font = style.font
-        font.name = details['font_name']
-        font.size = Pt(12)
-
-        # Header with icon placeholder and invoice/client details
-        table = doc.add_table(rows=1, cols=2)
-        table.autofit = False
-        table.columns[0].width = Inches(details['column_widths'][0])
-        table.columns[1].width = Inches(details['column_widths'][1])
-
-        # Left cell - Company Icon Placeholder
-        cell_left = table.cell(0, 0)
-        cell_left.text = '' # Clear placeholder text
-        # Add image - ensure the icon is in the same directory or provide full path
-        cell_left.paragraphs[0].add_run().add_picture(details['icon_name'], width=Inches(2.0))
-
-        # Right cell - Invoice Number and Client Info (placeholders)
-        cell_right = table.cell(0, 1)
-
-        # Add Company Name Heading
-        p_company_name = cell_right.paragraphs[0] # Use the first paragraph for the company name
-        p_company_name.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        run_company_name = p_company_name.add_run(details['company_name'])
-        run_company_name.bold = True
-        run_company_name.font.size = Pt(16)
-
-        # Get date - either from YAML or today's date
-        try:
-            if 'invoice_date' in details:
-                # Try to parse the date from YAML
-                parsed_date = datetime.strptime(details['invoice_date'], '%d.%m.%y')
-                today_date_str = parsed_date.strftime('%d.%m.%y')
-                logger.info(f"Using date from YAML file: {today_date_str}")
-            else:
-                today_date_str = date.today().strftime('%d.%m.%y')
-                logger.info(f"Using today's date: {today_date_str}")
-        except (ValueError, TypeError):
-            # If date parsing fails, use today's date
-            today_date_str = date.today().strftime('%d.%m.%y')
-            logger.warning(f"Failed to parse date from YAML, using today's date: {today_date_str}")
-
-        # Add Invoice details in a new paragraph below the company name
-        p_invoice_details = cell_right.add_paragraph() # Add a new paragraph for the rest
-        p_invoice_details.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        # Clear existing content before adding runs
-        p_invoice_details.text = '' 
-
-        # Add runs piece by piece to apply highlighting and formatting
-        run = p_invoice_details.add_run("Invoice #: ")
-        run.bold = True
-        run = p_invoice_details.add_run(str(details['invoice_number']))
-        run.bold = True
-
-        run = p_invoice_details.add_run(f"\nDate: {today_date_str}\n\n")
-        run.bold = True
-
-        run = p_invoice_details.add_run(details['client_name'])
-        run.bold = True
-
-        run = p_invoice_details.add_run("\n") # Keep the newline separate
-        run = p_invoice_details.add_run(details['client_address'])
-        run.bold = True
-
-        doc.add_paragraph()  # space
-
-        # Table for services
-        doc.add_paragraph("Invoice Details", style='Heading 2')
-
-        table = doc.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = 'Description of Service'
-        hdr_cells[1].text = 'Total'
-        hdr_cells[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
-
-        # Add background color to header cells
-        light_green_color = "A9D08E"
-        for cell in hdr_cells:
-            tcPr = cell._tc.get_or_add_tcPr()
-            shd = OxmlElement('w:shd')
-            shd.set(qn('w:fill'), light_green_color)
-            shd.set(qn('w:val'), 'clear')
-            tcPr.append(shd)
-
-        # Placeholder rows for services
-        subtotal = 0
-        if logger.isEnabledFor(logging.INFO):
-            logger.info("Processing services and calculating costs:")
-        for service in details['services']:
-            row_cells = table.add_row().cells
-            desc_cell = row_cells[0]
-            desc_cell.text = '' # Clear cell
-            run = desc_cell.paragraphs[0].add_run(service)
-            
-            # Extract hours from service description (e.g., "AI Consultancy (1 hour)" -> 1)
-            hours_match = re.search(r'\((\d+\.?\d*)\s*hours?\)', service)
-            hours = float(hours_match.group(1)) if hours_match else 0
-            
-            # Calculate cost
-            cost = hours * details['hourly_rate']
-            row_cells[1].text = f'£{cost:.2f}'
-            row_cells[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            
-            subtotal += cost
-            if logger.isEnabledFor(logging.INFO):
-                logger.info(f"Service: {service} - Hours: {hours} - Cost: £{cost:.2f}")
-
-        if logger.isEnabledFor(logging.INFO):
-            logger.info(f"Subtotal calculated: £{subtotal:.2f}")
-
-        # Totals
-        row_subtotal = table.add_row().cells
-        row_subtotal[0].text = 'Subtotal'
-        row_subtotal[1].text = f'£{subtotal:.2f}'
-        row_subtotal[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
-
-        vat_amount = subtotal * (details['vat_rate'] / 100)
-        if logger.isEnabledFor(logging.INFO):
-            logger.info(f"VAT amount calculated ({details['vat_rate']}%): £{vat_amount:.2f}")
-
-        row_vat = table.add_row().cells
-        row_vat[0].text = f'VAT ({details["vat_rate"]}%)'
-        row_vat[1].text = f'£{vat_amount:.2f}'
-        row_vat[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
-
-        total = subtotal + vat_amount
-        if logger.isEnabledFor(logging.INFO):
-            logger.info(f"Total amount due: £{total:.2f}")
-
-        row_total = table.add_row().cells
-        # Make both cells of Total Amount Due bold
-        total_due_cell = row_total[0]
-        total_due_cell.text = '' # Clear existing content
-        total_due_run = total_due_cell.paragraphs[0].add_run('Total Amount Due')
-        total_due_run.bold = True
-
-        # Make the amount bold too
-        total_amount_cell = row_total[1]
-        total_amount_cell.text = '' # Clear existing content
-        total_amount_run = total_amount_cell.paragraphs[0].add_run(f'£{total:.2f}')
-        total_amount_run.bold = True
-        total_amount_cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
-
-        doc.add_paragraph()  # space
-
-        # Footer details
-        footer_text = (
-            f"Payment terms of within {details['payment_terms_days']} days.\n"
-            "Please make payment by direct transfer to:\n"
-            f"Bank Address: {details['bank_address']}\n"
-            f"Account name: {details['company_name']}\n"
-            f"Account Number: {details['account_number']}\n"
-            f"Sort Code: {details['sort_code']}\n"
-            "\n"
-            "Thanks for your business!\n"
-            "\n"
-            f"{details['company_name']}, Registered in the UK. Company Number: {details['company_number']}\n"
-            f"Registered office: {details['registered_address']}\n"
-            f"Registered for VAT in the UK. Registration number: {details['vat_number']}\n"
-            f"Email: {details['email']} | Contact: {details['contact_number']}"
-        )
-
-        footer_paragraph = doc.add_paragraph()
-        run = footer_paragraph.add_run(footer_text)
-        run.font.size = Pt(8)
-
-        # Add PAID stamp as a watermark in the footer, bottom left, if paid
-        if details.get('paid'):
-            try:
-                current_dir = os.path.dirname(os.path.abspath(__file__))
-                stamp_path = os.path.join(current_dir, 'paid_stamp.png')
-                if os.path.exists(stamp_path):
-                    section = doc.sections[0]
-                    footer = section.footer
-                    # Add a new paragraph for the paid stamp image
-                    paragraph = footer.add_paragraph()
-                    run = paragraph.add_run()
-                    run.add_picture(stamp_path, width=Inches(1.5))
-                    paragraph.paragraph_format.space_after = 0
-                    paragraph.paragraph_format.space_before = 0
-                else:
-                    logger.warning(f"PAID stamp image not found at {stamp_path}")
-            except Exception as e:
-                logger.error(f"Failed to add PAID watermark to footer: {e}")
-
-        # Save the document with the new output path
-        if logger.isEnabledFor(logging.INFO):
-            logger.info(f"Saving invoice document to: {output_path}")
-        doc.save(output_path)
-
-        # Convert to PDF if requested
-        if arguments['--pdf']:
-            pdf_backend = arguments.get('--pdf-backend') or 'libreoffice'
-            pdf_path = convert_to_pdf(output_path, logger, backend=pdf_backend)
-            # Open the PDF instead of DOCX if it was generated
-            output_path = pdf_path
-
-        # Open the generated document on macOS
-        try:
-            if logger.isEnabledFor(logging.INFO):
-                logger.info(f"Attempting to open the document: {output_path}")
-            os.system(f"open '{output_path}'")
-            if logger.isEnabledFor(logging.INFO):
-                logger.info("Document opened successfully")
-        except Exception as e:
-            logger.error(f"Could not automatically open the file. Error: {e}")
-
-        if logger.isEnabledFor(logging.INFO):
-            logger.info("Invoice generation completed successfully")
+        if len(yaml_files) == 1:
+            output_paths = [generate_invoice(yaml_files[0], **options)]
+        else:
+            # Invoices are independent, so generate them in parallel worker processes.
+            # One listener is started here and shared, as every worker would
+            # otherwise race to start its own on the same port and profile.
+            soffice = shutil.which('soffice') or shutil.which('libreoffice')
+            if (options['pdf'] and options['persistent'] and options['backend'] == 'libreoffice'
+                    and soffice and shutil.which('unoconv')):
+                start_soffice_listener(soffice, _log)
+            _log.info("Generating %d invoices in parallel", len(yaml_files))
+            with ProcessPoolExecutor(
+                max_workers=min(len(yaml_files), os.cpu_count() or 1),
+                initializer=_init_batch_worker,
+                initargs=(arguments['--verbose'],)
+            ) as executor:
+                output_paths = list(executor.map(partial(generate_invoice, **options), yaml_files))
+
+        for output_path in output_paths:
+            open_document(output_path, _log)
+
+        _log.info("Invoice generation completed successfully")
         
     except Exception as e:
-        logger.error(f"Error generating invoice: {str(e)}")
+        _log.error("Error generating invoice: %s", e)
         sys.exit(1)
+    finally:
+        stop_soffice_listener()
 
 if __name__ == '__main__':
     main()
-
@@ -9,6 +9,7 @@ It leverages the core invoice generation logic from the invoice_generator.py scr
 - GET /version: API version and configuration information
 - GET /example-client: Returns an HTML test client
 - POST /generate-invoice: Generate and download invoice file
+- POST /generate-invoices: Generate several invoices and download them as a ZIP archive
     
 ## Authentication
 - No authentication is required for this version
@@ -21,7 +22,7 @@ It leverages the core invoice generation logic from the invoice_generator.py scr
 - Credentials are supported for authenticated requests
 
 ## Installation
-- pip install fastapi uvicorn pydantic python-docx pyyaml docopt
+- pip install fastapi "uvicorn[standard]" pydantic python-docx pyyaml docopt orjson
 
 ## Usage
 - Start the server using uvicorn:
@@ -35,11 +36,21 @@ It leverages the core invoice generation logic from the invoice_generator.py scr
   # Production mode (disable reload)
   uvicorn invoice_generator_api:app --host 0.0.0.0 --port 8083
   
+  # Production mode on all cores with the uvloop event loop and httptools parser
+  # (both come with uvicorn[standard]); WEB_CONCURRENCY sets the worker count and
+  # splits the unoserver pool between them
+  WEB_CONCURRENCY=$(nproc) uvicorn invoice_generator_api:app --host 0.0.0.0 --port 8083 \\
+      --loop uvloop --http httptools
+  
   # With verbose logging
   VERBOSE=True uvicorn invoice_generator_api:app --reload
   
   # Using Python module syntax
   python -m uvicorn invoice_generator_api:app --reload
+  
+  # Running the module directly starts one worker per core (or WEB_CONCURRENCY)
+  # on port 8083 with uvloop and httptools
+  python invoice_generator_api.py
   ```
 
 - Access Swagger UI: http://localhost:8083/docs
@@ -50,20 +61,33 @@ It leverages the core invoice generation logic from the invoice_generator.py scr
 1. The client sends invoice details as JSON to the /generate-invoice endpoint
 2. The service validates the input data using Pydantic models
 3. Invoice generation logic creates a DOCX document using python-docx
-4. If PDF format is requested, the service converts DOCX to PDF using unoconv
+4. If PDF format is requested, the service converts DOCX to PDF using headless LibreOffice
 5. The generated file is returned as a downloadable response
     
 ## Requirements
 - FastAPI: pip install fastapi
-- Uvicorn: pip install uvicorn
+- Uvicorn: pip install "uvicorn[standard]" (brings uvloop and httptools)
 - Pydantic: pip install pydantic
 - Python-DOCX: pip install python-docx
 - PyYAML: pip install pyyaml
 - Docopt: pip install docopt
+- orjson: pip install orjson
+- Brotli: pip install brotli (optional; the example client and OpenAPI schema are
+  served gzip-only without it)
+- msgspec: pip install msgspec (optional; lets /generate-invoice accept
+  MessagePack bodies sent with Content-Type: application/msgpack)
     
 For PDF conversion:
-- LibreOffice: brew install libreoffice
-- unoconv: brew install unoconv
+- LibreOffice: brew install libreoffice (the `soffice` binary must be on your PATH)
+- unoserver: pip install unoserver (optional; keeps one LibreOffice running for
+  all requests instead of starting a new one per PDF, which converts one PDF at a
+  time per process). Must be installed into a Python that can `import uno`.
+  Each API process starts UNOSERVER_WORKERS servers on free ports; by default
+  min(4, CPUs) divided by WEB_CONCURRENCY, at least one per process, so use
+  WEB_CONCURRENCY rather than --workers to set the worker count. Set
+  UNOSERVER_PORT/UNO_PORT to use fixed ports instead (worker i gets
+  UNOSERVER_PORT + 2i and UNO_PORT + 2i); fixed ports only work with a single
+  API process.
 
 ## Example API Request (using curl)
 
@@ -94,24 +118,57 @@ curl -X POST "http://localhost:8083/generate-invoice?format=pdf" \\
     -o invoice.pdf
 """
 
+import asyncio
+import atexit
+import base64
+import gzip
+import hashlib
+import io
+import math
 import os
+import queue
+import re
+import shutil
+import socket
+import subprocess
 import tempfile
+import time
+import zipfile
 import logging
-import yaml # type: ignore
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import Dict, List, Union, Optional, Set # type: ignore
-from fastapi import FastAPI, HTTPException, Query, status # type: ignore
-from fastapi.responses import FileResponse # type: ignore
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Union, Optional, Set # type: ignore
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+import orjson # type: ignore
+try:
+    import brotli # type: ignore
+except ImportError:
+    brotli = None
+try:
+    import msgspec # type: ignore
+except ImportError:
+    msgspec = None
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, status # type: ignore
+from fastapi.exceptions import RequestValidationError # type: ignore
+from fastapi.responses import FileResponse, HTMLResponse, Response # type: ignore
 from fastapi.middleware.cors import CORSMiddleware # type: ignore
-from pydantic import BaseModel, Field, field_validator # type: ignore
+from fastapi.middleware.gzip import GZipMiddleware # type: ignore
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES # type: ignore
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, conlist, field_validator # type: ignore
 from pathlib import Path
+from datetime import date, datetime
 from enum import Enum
 from fastapi.openapi.utils import get_openapi # type: ignore
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import parse_xml
-from docx.oxml.ns import nsdecls
-from docx.shared import Inches
+from docx import Document # type: ignore
+from docx.enum.text import WD_ALIGN_PARAGRAPH # type: ignore
+from docx.oxml import OxmlElement, parse_xml # type: ignore
+from docx.oxml.ns import nsdecls, qn # type: ignore
+from docx.shared import Inches, Pt # type: ignore
 
 # Configuration variables
 VERBOSE = os.environ.get('VERBOSE', 'False').lower() in ('true', '1', 't')
@@ -125,13 +182,80 @@ CORS_ALLOW_CREDENTIALS = os.environ.get('CORS_ALLOW_CREDENTIALS', 'True').lower(
 CORS_ALLOW_METHODS = ["GET", "POST", "OPTIONS"]
 CORS_ALLOW_HEADERS = ["*"]
 
-# Setup logging configuration
+# Hours in a service description, e.g. "(2 hours)" or "(1.5 hour)"
+# (the fractional part is only tried after a '.', so long digit runs cannot backtrack)
+_HOURS_RE = re.compile(r'\((\d+(?:\.\d*)?)\s*hours?\)')
+# Base64 payload of an image data: URL
+_DATA_URL_RE = re.compile(r'data:image/[^;]+;base64,(.+)')
+# Service date in DD.MM.YY or DD.MM.YYYY format
+_DATE_RE = re.compile(r'(\d{1,2}\.\d{1,2}\.\d{2,4})')
+# The same date with its surrounding whitespace, stripped from descriptions. A match
+# may only start where a whitespace run starts, so long runs are scanned once
+_DATE_SUB_RE = re.compile(r'(?<!\s)\s*\d{1,2}\.\d{1,2}\.\d{2,4}\s*')
+
+DOCX_MEDIA_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+# Fixed sizes used on every invoice; Length values are immutable so they can be shared
+_ICON_WIDTH = Inches(2.0)
+_STAMP_WIDTH = Inches(1.5)
+_COMPANY_NAME_SIZE = Pt(16)
+_BODY_FONT_SIZE = Pt(11)
+_FOOTER_FONT_SIZE = Pt(8)
+# Services table columns: Date, Description, Total
+_SERVICE_COLUMN_WIDTHS = (Inches(1.0), Inches(4.0), Inches(1.0))
+
+# Stamp placed in the footer of paid invoices
+PAID_STAMP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'paid_stamp.png')
+
+# unoserver configuration - a long-lived LibreOffice used for PDF conversion
+UNOSERVER_HOST = os.environ.get('UNOSERVER_HOST', '127.0.0.1')
+# Base ports for the unoserver pool; 0 picks free ports, which lets several
+# uvicorn worker processes each run their own pool
+UNOSERVER_PORT = int(os.environ.get('UNOSERVER_PORT', '0'))
+UNO_PORT = int(os.environ.get('UNO_PORT', '0'))
+# uvicorn worker processes sharing this host, as set with WEB_CONCURRENCY (which
+# uvicorn also reads for --workers). Each runs its own unoserver pool, so by
+# default the min(4, CPUs) LibreOffice instances are split between them.
+WEB_CONCURRENCY = int(os.environ.get('WEB_CONCURRENCY', '1'))
+UNOSERVER_WORKERS = int(os.environ.get(
+    'UNOSERVER_WORKERS', max(1, min(4, os.cpu_count() or 1) // WEB_CONCURRENCY)))
+
+# Number of generated DOCX files kept in memory per process
+DOCX_CACHE_SIZE = int(os.environ.get('DOCX_CACHE_SIZE', '128'))
+
+# Limits for the on-disk PDF cache: total size in MiB, and days since a PDF was
+# last served. The least recently used PDFs are removed first.
+PDF_CACHE_MAX_MB = int(os.environ.get('PDF_CACHE_MAX_MB', '512'))
+PDF_CACHE_MAX_DAYS = float(os.environ.get('PDF_CACHE_MAX_DAYS', '30'))
+
+# Most invoices accepted by one /generate-invoices request
+MAX_BATCH_INVOICES = int(os.environ.get('MAX_BATCH_INVOICES', '50'))
+
+# Cached PDFs up to this size are sent in one write; larger ones are streamed
+SMALL_FILE_LIMIT = 256 * 1024
+
+# Threads used to build and convert documents off the event loop. By default
+# there is one per unoserver, so every warm LibreOffice can be kept busy,
+# plus two so DOCX requests are not stuck behind PDF conversions.
+GENERATION_WORKERS = int(os.environ.get('GENERATION_WORKERS', UNOSERVER_WORKERS + 2))
+UNOSERVER_PROFILE = os.environ.get('UNOSERVER_PROFILE', 'file:///tmp/uno_profile')
+# Seconds between checks that restart unoserver workers which have died
+UNOSERVER_HEALTH_INTERVAL = float(os.environ.get('UNOSERVER_HEALTH_INTERVAL', '5'))
+
+# Setup logging configuration. Handlers only enqueue records; a listener thread
+# formats and writes them to stdout so request handlers never block on log I/O.
+_log_queue = queue.SimpleQueue()
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+log_listener = QueueListener(_log_queue, _stdout_handler)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # full format is applied by the listener
 logging.basicConfig(
     level=LOG_LEVEL,
-    format=LOG_FORMAT,
-    datefmt=LOG_DATE_FORMAT,
-    stream=sys.stdout
+    handlers=[_queue_handler]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
@@ -140,15 +264,8 @@ logger = logging.getLogger(__name__)
 from invoice_generator import (
     setup_logging,
     ensure_invoices_directory,
-    get_output_path,
     convert_to_pdf,
-    get_pdf_path,
-    Document,
-    WD_ALIGN_PARAGRAPH,
-    Inches,
-    Pt,
-    OxmlElement,
-    qn
+    get_pdf_path
 )
 
 # Define output format enum for better Swagger docs
@@ -156,21 +273,143 @@ class OutputFormat(str, Enum):
     DOCX = "docx"
     PDF = "pdf"
 
+MEDIA_TYPES = {
+    OutputFormat.DOCX: DOCX_MEDIA_TYPE,
+    OutputFormat.PDF: "application/pdf",
+}
+
 # Configure the invoice_generator module's logging
 setup_logging(verbose=VERBOSE)
 
+# A line per request is only worth its cost while debugging; this also covers
+# servers started with the uvicorn CLI, which logs access by default
+if not VERBOSE:
+    logging.getLogger('uvicorn.access').setLevel(logging.WARNING)
+
 logger.info(f"Starting Invoice Generator API with VERBOSE={VERBOSE}")
 
+def _free_ports(count: int) -> List[int]:
+    """
+    Ask the OS for distinct unused TCP ports on the unoserver interface. Every
+    probe socket stays bound until all ports are picked, so none is handed out twice.
+    """
+    socks = []
+    try:
+        for _ in range(count):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            socks.append(sock)
+            sock.bind((UNOSERVER_HOST, 0))
+        return [sock.getsockname()[1] for sock in socks]
+    finally:
+        for sock in socks:
+            sock.close()
+
+def _profile_dir(proc: subprocess.Popen) -> Optional[str]:
+    """Get the local path of the --user-installation profile an unoserver was started with."""
+    args = list(proc.args)
+    if '--user-installation' not in args:
+        return None
+    url = args[args.index('--user-installation') + 1]
+    return url2pathname(urlparse(url).path)
+
+def start_unoservers(count: int) -> Dict[int, subprocess.Popen]:
+    """
+    Start a pool of persistent unoservers so PDF conversions reuse warm LibreOffice
+    instances. Each worker gets its own ports and user profile so they can convert
+    concurrently without sharing LibreOffice's profile lock.
+    Returns the running servers keyed by their XML-RPC port.
+    """
+    unoserver = shutil.which('unoserver')
+    if not unoserver:
+        logger.warning("unoserver not found on PATH; PDFs will be converted with a fresh LibreOffice per request")
+        return {}
+    procs = {}
+    free_ports = iter(_free_ports(2 * count))
+    for i in range(count):
+        port = UNOSERVER_PORT + 2 * i if UNOSERVER_PORT else next(free_ports)
+        uno_port = UNO_PORT + 2 * i if UNO_PORT else next(free_ports)
+        logger.info("Starting unoserver worker %d on %s:%d (UNO port %d)", i, UNOSERVER_HOST, port, uno_port)
+        procs[port] = subprocess.Popen(
+            [unoserver, '--interface', UNOSERVER_HOST, '--port', str(port),
+             '--uno-port', str(uno_port), '--user-installation', f"{UNOSERVER_PROFILE}_{os.getpid()}_{i}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    return procs
+
+async def watch_unoservers(procs: Dict[int, subprocess.Popen], interval: float) -> None:
+    """
+    Restart any unoserver in the pool that has exited, with its original command
+    line, so a crashed LibreOffice costs one failed conversion rather than a
+    permanently slower worker. Runs until cancelled.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        for port, proc in procs.items():
+            if proc.poll() is not None:
+                logger.warning("unoserver on port %d exited with code %s; restarting", port, proc.returncode)
+                procs[port] = subprocess.Popen(
+                    proc.args,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+
+def stop_unoservers(procs: Iterable[subprocess.Popen]) -> None:
+    """Terminate the unoservers started by start_unoservers and remove their profiles."""
+    procs = list(procs)
+    running = [proc for proc in procs if proc.poll() is None]
+    if running:
+        logger.info("Stopping %d unoserver worker(s)", len(running))
+    for proc in running:
+        proc.terminate()
+    for proc in running:
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    # Profiles are per process and worker, so each restart would otherwise leave more behind
+    for proc in procs:
+        profile = _profile_dir(proc)
+        if profile:
+            shutil.rmtree(profile, ignore_errors=True)
+
 # Lifespan event handler for startup and shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Invoice Generator API is starting up")
+    get_docx_template()  # build the document skeleton before the first request
+    openapi_representations(app.root_path.rstrip("/"))  # build, serialize and compress the OpenAPI schema before /docs is first hit
     logger.info(f"Verbose logging is {'enabled' if VERBOSE else 'disabled'}")
     logger.info(f"API documentation available at http://localhost:8083/docs")
+    # Scratch space for PDF conversions; anything a failed request leaves behind
+    # goes when the app shuts down
+    app.state.tmpdir = tempfile.mkdtemp(prefix='invgen_')
+    # Document generation is blocking, so handlers hand it to this pool; it is
+    # created per lifespan so the app can be started again after a shutdown
+    app.state.executor = ThreadPoolExecutor(max_workers=GENERATION_WORKERS, thread_name_prefix='invoice')
+    prune_pdf_cache()
+    app.state.unoservers = start_unoservers(UNOSERVER_WORKERS)
+    # At most one conversion per unoserver worker at a time. Without unoserver the
+    # cold soffice runs share the default profile, which LibreOffice locks, so
+    # they are serialized
+    app.state.pdf_semaphore = asyncio.Semaphore(len(app.state.unoservers) or 1)
+    # Idle unoserver ports; a PDF request takes one for the duration of its conversion
+    app.state.unoserver_ports = None
+    if app.state.unoservers:
+        app.state.unoserver_ports = asyncio.Queue()
+        for port in app.state.unoservers:
+            app.state.unoserver_ports.put_nowait(port)
+        watchdog = asyncio.create_task(watch_unoservers(app.state.unoservers, UNOSERVER_HEALTH_INTERVAL))
     yield
     # Shutdown
     logger.info("Invoice Generator API is shutting down")
+    if app.state.unoservers:
+        watchdog.cancel()
+    stop_unoservers(app.state.unoservers.values())
+    app.state.executor.shutdown(wait=True)
+    shutil.rmtree(app.state.tmpdir, ignore_errors=True)
 
 # Create FastAPI app with enhanced metadata
 app = FastAPI(
@@ -214,10 +453,55 @@ app.add_middleware(
 
 logger.info(f"CORS middleware configured with origins: {CORS_ORIGINS}")
 
+# Compress JSON and HTML responses. DOCX, PDF and ZIP downloads are already
+# compressed, so the middleware skips them by content type.
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=512,
+    compresslevel=6,
+    exclude_content_types=(*DEFAULT_EXCLUDED_CONTENT_TYPES, *MEDIA_TYPES.values(), "application/zip"),
+)
+
 # Ensure the invoices directory exists
 invoices_dir = ensure_invoices_directory()
 logger.info(f"Using invoices directory: {invoices_dir}")
 
+# Converted PDFs, keyed by a hash of the invoice details they were built from.
+# They live on disk so all worker processes share them, and are pruned to
+# PDF_CACHE_MAX_MB and PDF_CACHE_MAX_DAYS as new ones are added.
+pdf_cache_dir = invoices_dir / '.pdf_cache'
+pdf_cache_dir.mkdir(exist_ok=True)
+
+# Recently generated DOCX files, keyed the same way; only touched from the event loop
+_docx_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+# Example request shown in the OpenAPI schema and /docs
+_INVOICE_EXAMPLE = {
+    "client_name": "Mike Smith",
+    "client_address": "17 Poland St.\nLondon\nW2 4ZZ\nU.K.",
+    "services": ["AI Consultancy 29.03.25 (1 hour)", "Notes write up 29.03.25 (1 hour)"],
+    "service_date": "29.03.25",
+    "service_description": "AI Consultancy and Documentation Services",
+    "payment_terms_days": 30,
+    "invoice_number": 1008,
+    "invoice_date": "21.04.25",
+    "company_name": "My Consulting Ltd",
+    "hourly_rate": 300,
+    "vat_rate": 20,
+    "account_number": "12345678",
+    "sort_code": "12-34-56",
+    "bank_address": "123 Bank St, London, UK",
+    "company_number": "12345678",
+    "vat_number": "GB123456789",
+    "registered_address": "123 Business St, London, UK",
+    "email": "contact@myconsulting.com",
+    "contact_number": "07700 900123",
+    "column_widths": [2.5, 3.5],
+    "font_name": "DejaVu Sans",
+    "icon_name": "DioramaConsultingIcon.png",
+    "icon_data": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+P+/HgAFdwI2hN4pSgAAAABJRU5ErkJggg=="
+}
+
 class InvoiceDetails(BaseModel):
     """
     Invoice details model containing all fields required to generate an invoice
@@ -225,298 +509,531 @@ class InvoiceDetails(BaseModel):
     client_name: str = Field(
         ..., 
         description="Client's full name or company name",
-        example="Mike Smith"
+        examples=["Mike Smith"]
     )
     client_address: str = Field(
         ..., 
         description="Client's full address with line breaks as needed",
-        example="17 Poland St.\nLondon\nW2 4ZZ\nU.K."
+        examples=["17 Poland St.\nLondon\nW2 4ZZ\nU.K."]
     )
     services: List[str] = Field(
         ..., 
         description="List of services with date (DD.MM.YY) and hours in parentheses, e.g. 'Service name 21.04.25 (2 hours)'",
-        example=["AI Consultancy 29.03.25 (1 hour)", "Notes write up 29.03.25 (1 hour)"]
+        examples=[["AI Consultancy 29.03.25 (1 hour)", "Notes write up 29.03.25 (1 hour)"]]
     )
     service_date: Optional[str] = Field(
         None,
         description="Date when the service was provided in DD.MM.YY format",
-        example="21.04.25"
+        examples=["21.04.25"]
     )
     service_description: Optional[str] = Field(
         None,
         description="General description of the service provided",
-        example="AI Consultancy and Documentation"
+        examples=["AI Consultancy and Documentation"]
     )
     payment_terms_days: int = Field(
         ..., 
         description="Payment terms in days",
-        example=30,
+        examples=[30],
         gt=0
     )
     invoice_number: int = Field(
         ..., 
         description="Unique invoice number",
-        example=1008,
+        examples=[1008],
         gt=0
     )
     invoice_date: Optional[str] = Field(
         None, 
         description="Invoice date in DD.MM.YY format. If not provided, today's date will be used",
-        example="21.04.25"
+        examples=["21.04.25"],
+        validate_default=True
     )
     company_name: str = Field(
         ..., 
         description="Your company name",
-        example="My Consulting Ltd"
+        examples=["My Consulting Ltd"]
     )
     hourly_rate: float = Field(
         ..., 
         description="Hourly rate in GBP",
-        example=300.0,
+        examples=[300.0],
         gt=0
     )
     vat_rate: float = Field(
         20.0, 
         description="VAT rate as a percentage",
-        example=20.0,
+        examples=[20.0],
         ge=0
     )
     account_number: str = Field(
         ..., 
         description="Bank account number",
-        example="12345678"
+        examples=["12345678"]
     )
     sort_code: str = Field(
         ..., 
         description="Bank sort code",
-        example="12-34-56"
+        examples=["12-34-56"]
     )
     bank_address: str = Field(
         ..., 
         description="Bank address",
-        example="123 Bank St, London, UK"
+        examples=["123 Bank St, London, UK"]
     )
     company_number: str = Field(
         ..., 
         description="Company registration number",
-        example="12345678"
+        examples=["12345678"]
     )
     vat_number: str = Field(
         ..., 
         description="VAT registration number",
-        example="GB123456789"
+        examples=["GB123456789"]
     )
     registered_address: str = Field(
         ..., 
         description="Company registered address",
-        example="123 Business St, London, UK"
+        examples=["123 Business St, London, UK"]
     )
     email: str = Field(
         ..., 
         description="Contact email address",
-        example="contact@myconsulting.com"
+        examples=["contact@myconsulting.com"]
     )
     contact_number: str = Field(
         ..., 
         description="Contact phone number",
-        example="07700 900123"
+        examples=["07700 900123"]
     )
     column_widths: List[float] = Field(
         [2.5, 3.5], 
         description="Document column widths in inches [left, right]",
-        example=[2.5, 3.5]
+        examples=[[2.5, 3.5]]
     )
     font_name: str = Field(
         "DejaVu Sans", 
         description="Font name to use in the document",
-        example="DejaVu Sans"
+        examples=["DejaVu Sans"]
     )
     icon_name: str = Field(
         "DioramaConsultingIcon.png", 
         description="Company icon/logo filename (must be in the same directory)",
-        example="DioramaConsultingIcon.png"
+        examples=["DioramaConsultingIcon.png"]
     )
     icon_data: Optional[str] = Field(
         None,
         description="Base64 encoded image data for the icon",
-        example="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAA..."
+        examples=["data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAA..."]
     )
     icon_hash: Optional[str] = Field(
         None,
         description="Hash reference to the stored image data",
-        example="abc123def456"
+        examples=["abc123def456"]
     )
     paid: Optional[bool] = Field(
         False,
         description="Whether the invoice has been paid",
-        example=False
+        examples=[False]
     )
     
-    @field_validator('services')
+    @field_validator('services', mode='after')
     @classmethod
     def validate_services(cls, v):
         """Validate that services contain date and hours in parentheses"""
-        import re
-        for service in v:
-            # Check for hours in parentheses
-            if not re.search(r'\(\d+\.?\d*\s*hours?\)', service):
-                raise ValueError(f"Service '{service}' must include hours in parentheses, e.g. '(2 hours)'")
-            
-            # Check for date in format DD.MM.YY or DD.MM.YYYY
-            if not re.search(r'\d{1,2}\.\d{1,2}\.\d{2,4}', service):
-                raise ValueError(f"Service '{service}' must include a date in format DD.MM.YY, e.g. '21.04.25'")
+        # Check for hours in parentheses
+        missing_hours = [service for service in v if not _HOURS_RE.search(service)]
+        if missing_hours:
+            raise ValueError(f"Service '{missing_hours[0]}' must include hours in parentheses, e.g. '(2 hours)'")
+        
+        # Check for date in format DD.MM.YY or DD.MM.YYYY
+        missing_date = [service for service in v if not _DATE_RE.search(service)]
+        if missing_date:
+            raise ValueError(f"Service '{missing_date[0]}' must include a date in format DD.MM.YY, e.g. '21.04.25'")
         return v
+    
+    @field_validator('invoice_date', mode='after')
+    @classmethod
+    def normalize_invoice_date(cls, v):
+        """Normalize the invoice date to DD.MM.YY, using today's date if it is missing or invalid"""
+        if v:
+            try:
+                return datetime.strptime(v, '%d.%m.%y').strftime('%d.%m.%y')
+            except ValueError as e:
+                logger.warning("Failed to parse date (%s), using today's date", e)
+        return date.today().strftime('%d.%m.%y')
         
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "client_name": "Mike Smith",
-                "client_address": "17 Poland St.\nLondon\nW2 4ZZ\nU.K.",
-                "services": ["AI Consultancy 29.03.25 (1 hour)", "Notes write up 29.03.25 (1 hour)"],
-                "service_date": "29.03.25",
-                "service_description": "AI Consultancy and Documentation Services",
-                "payment_terms_days": 30,
-                "invoice_number": 1008,
-                "invoice_date": "21.04.25",
-                "company_name": "My Consulting Ltd",
-                "hourly_rate": 300,
-                "vat_rate": 20,
-                "account_number": "12345678",
-                "sort_code": "12-34-56",
-                "bank_address": "123 Bank St, London, UK",
-                "company_number": "12345678",
-                "vat_number": "GB123456789",
-                "registered_address": "123 Business St, London, UK",
-                "email": "contact@myconsulting.com",
-                "contact_number": "07700 900123",
-                "column_widths": [2.5, 3.5],
-                "font_name": "DejaVu Sans",
-                "icon_name": "DioramaConsultingIcon.png",
-                "icon_data": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+P+/HgAFdwI2hN4pSgAAAABJRU5ErkJggg=="
-            }
+    model_config = ConfigDict(json_schema_extra={"example": _INVOICE_EXAMPLE})
+
+MSGPACK_MEDIA_TYPES = ('application/msgpack', 'application/x-msgpack')
+
+_invoice_adapter = TypeAdapter(InvoiceDetails)
+_invoice_batch_adapter = TypeAdapter(conlist(InvoiceDetails, min_length=1, max_length=MAX_BATCH_INVOICES))
+
+async def read_validated_body(request: Request, adapter: TypeAdapter):
+    """
+    Parse a JSON or, when msgspec is installed, a MessagePack request body and
+    validate it with the given adapter.
+    """
+    body = await request.body()
+    content_type = request.headers.get('content-type', '').split(';')[0].strip().lower()
+    try:
+        if content_type in MSGPACK_MEDIA_TYPES:
+            if msgspec is None:
+                raise HTTPException(
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    detail="MessagePack request bodies require the msgspec package"
+                )
+            try:
+                data = msgspec.msgpack.decode(body)
+            except msgspec.DecodeError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid MessagePack body: {e}")
+            return adapter.validate_python(data)
+        return adapter.validate_json(body)
+    except ValidationError as e:
+        # Report locations under "body", as FastAPI does for declared body parameters
+        errors = [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        raise RequestValidationError(errors, body=body)
+
+async def parse_invoice_details(request: Request) -> InvoiceDetails:
+    """Parse and validate a single invoice request body."""
+    return await read_validated_body(request, _invoice_adapter)
+
+async def parse_invoice_batch(request: Request) -> List[InvoiceDetails]:
+    """Parse and validate a /generate-invoices request body: a list of invoices."""
+    return await read_validated_body(request, _invoice_batch_adapter)
+
+# parse_invoice_details reads the body itself, so describe it for the OpenAPI schema
+_INVOICE_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        media_type: {"schema": {"$ref": "#/components/schemas/InvoiceDetails"}}
+        for media_type in ('application/json',) + MSGPACK_MEDIA_TYPES
+    },
+}
+
+_INVOICE_BATCH_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        media_type: {"schema": {
+            "type": "array",
+            "items": {"$ref": "#/components/schemas/InvoiceDetails"},
+            "minItems": 1,
+            "maxItems": MAX_BATCH_INVOICES,
+        }}
+        for media_type in ('application/json',) + MSGPACK_MEDIA_TYPES
+    },
+}
+
+@lru_cache(maxsize=64)
+def decode_icon_data(icon_data: str) -> bytes:
+    """
+    Decode base64 icon data, with or without a data: URL prefix.
+    Clients tend to send the same logo with every request, so results are cached.
+    """
+    base64_data = icon_data
+    if base64_data.startswith('data:'):
+        # Extract the base64 part after the comma
+        match = _DATA_URL_RE.match(base64_data)
+        if match:
+            base64_data = match.group(1)
+        else:
+            logger.warning("Couldn't parse base64 data URL format")
+    return base64.b64decode(base64_data)
+
+@lru_cache(maxsize=64)
+def resolve_icon_path(icon_name: str) -> str:
+    """
+    Find an icon file by name: as given, then in the backend directory, then in
+    the invoices directory. Found paths are cached; a missing icon raises
+    FileNotFoundError, which is not cached, so icons added later are picked up.
+    """
+    candidates = (
+        icon_name,
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), icon_name),
+        os.path.join(invoices_dir, icon_name),
+    )
+    for icon_path in candidates:
+        logger.info("Attempting to load icon from: %s", icon_path)
+        if os.path.exists(icon_path):
+            return icon_path
+    raise FileNotFoundError(f"Icon file not found in any location: {icon_name}")
+
+@lru_cache(maxsize=64)
+def _inches(value: float) -> Inches:
+    """Return a cached Inches length for a client-supplied column width."""
+    return Inches(value)
+
+@lru_cache(maxsize=None)
+def get_docx_template() -> bytes:
+    """
+    Build the parts of the invoice document that do not depend on the details
+    (default font size, table layout and styles, headings, header row shading)
+    once per process and return them as DOCX bytes.
+    """
+    doc = Document()
+    doc.styles['Normal'].font.size = _BODY_FONT_SIZE
+
+    # Header table for the icon and invoice/client details
+    table = doc.add_table(rows=1, cols=2)
+    table.autofit = False
+
+    doc.add_paragraph()  # space
+
+    # Table for services
+    doc.add_paragraph("Invoice Details", style='Heading 2')
+
+    table = doc.add_table(rows=1, cols=3)
+    table.style = 'Table Grid'
+    # Set custom column widths: Date, Description, Total
+    for column, width in zip(table.columns, _SERVICE_COLUMN_WIDTHS):
+        column.width = width
+    hdr_cells = table.rows[0].cells
+    hdr_cells[0].text = 'Date'
+    hdr_cells[1].text = 'Description of Service'
+    hdr_cells[2].text = 'Total'
+    hdr_cells[0].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+    hdr_cells[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.LEFT
+    hdr_cells[2].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
+
+    # Add background color to header cells
+    light_green_color = "A9D08E"
+    for cell in hdr_cells:
+        tcPr = cell._tc.get_or_add_tcPr()
+        shd = OxmlElement('w:shd')
+        shd.set(qn('w:fill'), light_green_color)
+        shd.set(qn('w:val'), 'clear')
+        tcPr.append(shd)
+
+    doc.add_paragraph()  # space
+
+    # Footer details paragraph, filled in per invoice
+    doc.add_paragraph().add_run().font.size = _FOOTER_FONT_SIZE
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+def attachment_response(content: bytes, media_type: str, filename: str) -> Response:
+    """Return generated invoice bytes as a file download."""
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
         }
+    )
+
+def make_etag(content: bytes) -> str:
+    """Strong ETag for a fixed response body."""
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header already names this ETag."""
+    if_none_match = request.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(tag.strip().removeprefix('W/') == etag for tag in if_none_match.split(','))
+
+def conditional_response(request: Request, content: bytes, media_type: str, headers: Dict[str, str]) -> Response:
+    """
+    Return a fixed body, or an empty 304 Not Modified when the client already
+    holds it. headers must include the body's ETag.
+    """
+    if etag_matches(request, headers["ETag"]):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={name: value for name, value in headers.items() if name in ("ETag", "Cache-Control", "Vary")},
+        )
+    return Response(content, media_type=media_type, headers=headers)
+
+# Salts every cache key with this module's source, which holds the document
+# template, so PDFs cached by an older version are never served
+_CACHE_VERSION = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).digest()
+
+def get_invoice_cache_key(details: Dict) -> str:
+    """
+    Hash the invoice details; identical details always produce the same invoice.
+    An icon given by name is read from disk, so its size and modification time
+    are part of the key too.
+    """
+    key = hashlib.blake2b(_CACHE_VERSION, digest_size=16)
+    key.update(orjson.dumps(details, option=orjson.OPT_SORT_KEYS))
+    if details.get('icon_name') and not details.get('icon_data'):
+        try:
+            icon_stat = os.stat(resolve_icon_path(details['icon_name']))
+            key.update(f"{icon_stat.st_size}:{icon_stat.st_mtime_ns}".encode())
+        except (FileNotFoundError, ValueError):
+            pass  # generated without the icon, which a later request may find
+    return key.hexdigest()
+
+def get_pdf_cache_path(cache_key: str) -> Path:
+    """Get the cache path for the PDF built from the invoice details with this key."""
+    return pdf_cache_dir / f"{cache_key}.pdf"
+
+def get_cached_docx(cache_key: str) -> Optional[bytes]:
+    """Look up a generated DOCX in the in-memory cache, marking it recently used."""
+    content = _docx_cache.get(cache_key)
+    if content is not None:
+        _docx_cache.move_to_end(cache_key)
+    return content
+
+def store_cached_docx(cache_key: str, content: bytes) -> None:
+    """Add a generated DOCX to the in-memory cache, evicting the least recently used."""
+    _docx_cache[cache_key] = content
+    _docx_cache.move_to_end(cache_key)
+    while len(_docx_cache) > DOCX_CACHE_SIZE:
+        _docx_cache.popitem(last=False)
+
+def get_cached_pdf(cache_path: Path) -> bool:
+    """Check for a cached PDF, marking it recently used so pruning keeps it."""
+    try:
+        os.utime(cache_path)
+    except FileNotFoundError:
+        return False
+    return True
+
+def store_cached_pdf(cache_path: Path, pdf_path: Path) -> None:
+    """Atomically move a converted PDF into the cache."""
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+    os.close(fd)
+    shutil.move(pdf_path, tmp_name)
+    os.replace(tmp_name, cache_path)
+
+def prune_pdf_cache() -> None:
+    """
+    Remove cached PDFs not served within PDF_CACHE_MAX_DAYS, then the least
+    recently used ones until the cache fits in PDF_CACHE_MAX_MB.
+    """
+    entries = []
+    with os.scandir(pdf_cache_dir) as it:
+        for entry in it:
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # removed by another worker process
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    oldest_allowed = time.time() - PDF_CACHE_MAX_DAYS * 86400
+    max_bytes = PDF_CACHE_MAX_MB * 1024 * 1024
+    for mtime, size, path in entries:
+        if mtime >= oldest_allowed and total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+class LargeFileResponse(FileResponse):
+    """FileResponse that reads in 1 MiB chunks, so big files take fewer thread hops."""
+    chunk_size = 1024 * 1024
+
+async def file_attachment_response(path: Path, media_type: str, filename: str) -> Response:
+    """
+    Send a generated invoice file from disk as a file download. Small files are
+    read in one go and sent as a single body; larger ones are streamed by
+    FileResponse, which takes the zero-copy path on servers that support it.
+    """
+    if path.stat().st_size <= SMALL_FILE_LIMIT:
+        content = await asyncio.get_running_loop().run_in_executor(app.state.executor, path.read_bytes)
+        return attachment_response(content, media_type, filename)
+    return LargeFileResponse(
+        path,
+        media_type=media_type,
+        filename=filename,
+    )
 
-def generate_invoice_document(details: Dict, output_path: Path, generate_pdf: bool = False):
+def convert_with_unoserver(docx_path: Path, port: int) -> Path:
+    """
+    Convert a DOCX file to PDF through a running unoserver, falling back to
+    convert_to_pdf if unoconvert is unavailable or the conversion fails.
+    """
+    pdf_path = get_pdf_path(docx_path)
+    unoconvert = shutil.which('unoconvert')
+    if unoconvert:
+        result = subprocess.run(
+            [unoconvert, '--host', UNOSERVER_HOST, '--port', str(port),
+             '--convert-to', 'pdf', str(docx_path), str(pdf_path)],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0 and pdf_path.exists():
+            return pdf_path
+        logger.warning("unoconvert failed (exit %d): %s", result.returncode, result.stderr.strip())
+    else:
+        logger.warning("unoconvert not found on PATH")
+    return convert_to_pdf(docx_path, logger)
+
+def generate_invoice_document(details: Dict, output_path: Union[Path, io.BytesIO], generate_pdf: bool = False,
+                              unoserver_port: Optional[int] = None):
     """
     Generate an invoice document based on the provided details.
     This function is adapted from the main() function in invoice_generator.py.
+    output_path may be a buffer when no PDF is needed, since PDF conversion
+    works on a file. When unoserver_port is given, PDF conversion goes
+    through that unoserver.
     """
-    logger.info(f"Starting invoice generation for invoice #{details['invoice_number']} at {output_path}")
-    logger.debug(f"Invoice details: {details}")
+    logger.info("Starting invoice generation for invoice #%s at %s", details['invoice_number'], output_path)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Invoice details: %s", orjson.dumps(details).decode())
     
-    # Create and configure document
-    doc = Document()
-    logger.debug("Created new Document object")
+    # Start from the cached skeleton and fill in the per-invoice parts
+    doc = Document(io.BytesIO(get_docx_template()))
+    logger.debug("Created Document from cached template")
     
     # Set default font
-    style = doc.styles['Normal']
-    font = style.font
-    font.name = details['font_name']
-    font.size = Pt(11)
-    logger.debug(f"Set default font to {details['font_name']} with size 11pt")
+    doc.styles['Normal'].font.name = details['font_name']
+    logger.debug("Set default font to %s with size 11pt", details['font_name'])
 
     # Header with icon placeholder and invoice/client details
-    table = doc.add_table(rows=1, cols=2)
-    table.autofit = False
-    table.columns[0].width = Inches(details['column_widths'][0])
-    table.columns[1].width = Inches(details['column_widths'][1])
-    logger.debug(f"Created header table with column widths {details['column_widths']}")
+    header_table, table = doc.tables
+    header_table.columns[0].width = _inches(details['column_widths'][0])
+    header_table.columns[1].width = _inches(details['column_widths'][1])
+    logger.debug("Created header table with column widths %s", details['column_widths'])
 
     # Left cell - Company Icon Placeholder
-    cell_left = table.cell(0, 0)
+    cell_left = header_table.cell(0, 0)
     cell_left.text = '' # Clear placeholder text
     
     # Add image - handle both file path and base64 data
     try:
         # First check if we have icon_data (base64)
         if 'icon_data' in details and details['icon_data']:
-            logger.info(f"Using provided base64 icon data for {details['icon_name']}")
-            import base64
-            import tempfile
-            import re
-            
-            # Extract the actual base64 content if it has a data URL prefix
-            base64_data = details['icon_data']
-            if base64_data.startswith('data:'):
-                # Extract the base64 part after the comma
-                match = re.match(r'data:image/[^;]+;base64,(.+)', base64_data)
-                if match:
-                    base64_data = match.group(1)
-                else:
-                    logger.warning(f"Couldn't parse base64 data URL format")
-            
-            # Create a temporary file with the icon data
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.' + details['icon_name'].split('.')[-1]) as temp_icon:
-                temp_icon.write(base64.b64decode(base64_data))
-                temp_icon_path = temp_icon.name
-                
-            logger.info(f"Created temporary icon file at: {temp_icon_path}")
-            cell_left.paragraphs[0].add_run().add_picture(temp_icon_path, width=Inches(2.0))
-            logger.info(f"Successfully added company icon from base64 data")
-            
-            # Clean up the temporary file
-            try:
-                os.unlink(temp_icon_path)
-                logger.debug(f"Removed temporary icon file: {temp_icon_path}")
-            except Exception as e:
-                logger.warning(f"Could not remove temporary icon file: {e}")
+            logger.info("Using provided base64 icon data for %s", details['icon_name'])
+            icon_bytes = decode_icon_data(details['icon_data'])
+            cell_left.paragraphs[0].add_run().add_picture(io.BytesIO(icon_bytes), width=_ICON_WIDTH)
+            logger.info("Successfully added company icon from base64 data")
         
         # If no icon_data, try to find the file by name
         else:
-            # First try with the exact name provided
-            icon_path = details['icon_name']
-            logger.info(f"Attempting to load icon from: {icon_path}")
-            
-            if not os.path.exists(icon_path):
-                # If not found, check in the current directory
-                current_dir = os.path.dirname(os.path.abspath(__file__))
-                icon_path = os.path.join(current_dir, details['icon_name'])
-                logger.info(f"Icon not found at direct path, trying current directory: {icon_path}")
-                
-                if not os.path.exists(icon_path):
-                    # Also check in the invoices directory
-                    icon_path = os.path.join(invoices_dir, details['icon_name'])
-                    logger.info(f"Icon not found in current directory, trying invoices directory: {icon_path}")
-                    
-                    if not os.path.exists(icon_path):
-                        raise FileNotFoundError(f"Icon file not found in any location: {details['icon_name']}")
-            
-            cell_left.paragraphs[0].add_run().add_picture(icon_path, width=Inches(2.0))
-            logger.info(f"Successfully added company icon from: {icon_path}")
+            icon_path = resolve_icon_path(details['icon_name'])
+            cell_left.paragraphs[0].add_run().add_picture(icon_path, width=_ICON_WIDTH)
+            logger.info("Successfully added company icon from: %s", icon_path)
     except Exception as e:
-        logger.warning(f"Could not add company icon: {str(e)}")
-        logger.warning(f"Attempted to find icon at: {details['icon_name']}")
+        logger.warning("Could not add company icon: %s", e)
+        logger.warning("Attempted to find icon at: %s", details['icon_name'])
         icon_missing_text = f"{details['company_name']} (Icon not found)"
         cell_left.text = icon_missing_text
-        logger.debug(f"Using text placeholder for icon: {icon_missing_text}")
+        logger.debug("Using text placeholder for icon: %s", icon_missing_text)
         logger.warning("Make sure the icon file is available in the backend directory or provide a full path")
 
     # Right cell - Invoice Number and Client Info
-    cell_right = table.cell(0, 1)
+    cell_right = header_table.cell(0, 1)
 
     # Add Company Name Heading
     p_company_name = cell_right.paragraphs[0] # Use the first paragraph for the company name
     p_company_name.alignment = WD_ALIGN_PARAGRAPH.RIGHT
     run_company_name = p_company_name.add_run(details['company_name'])
     run_company_name.bold = True
-    run_company_name.font.size = Pt(16)
-    logger.debug(f"Added company name: {details['company_name']}")
+    run_company_name.font.size = _COMPANY_NAME_SIZE
+    logger.debug("Added company name: %s", details['company_name'])
 
-    # Get date from provided details or use today's date
-    from datetime import date, datetime
-    try:
-        if 'invoice_date' in details and details['invoice_date']:
-            # Try to parse the date from input
-            parsed_date = datetime.strptime(details['invoice_date'], '%d.%m.%y')
-            today_date_str = parsed_date.strftime('%d.%m.%y')
-            logger.info(f"Using provided date: {today_date_str}")
-        else:
-            today_date_str = date.today().strftime('%d.%m.%y')
-            logger.info(f"Using today's date: {today_date_str}")
-    except (ValueError, TypeError) as e:
-        # If date parsing fails, use today's date
-        today_date_str = date.today().strftime('%d.%m.%y')
-        logger.warning(f"Failed to parse date ({e}), using today's date: {today_date_str}")
+    # The model has already normalized the date, defaulting to today
+    today_date_str = details['invoice_date']
 
     # Add Invoice details in a new paragraph below the company name
     p_invoice_details = cell_right.add_paragraph() # Add a new paragraph for the rest
@@ -539,76 +1056,50 @@ def generate_invoice_document(details: Dict, output_path: Path, generate_pdf: bo
     run = p_invoice_details.add_run("\n") # Keep the newline separate
     run = p_invoice_details.add_run(details['client_address'])
     run.bold = True
-    logger.debug(f"Added invoice header with number {details['invoice_number']} and client {details['client_name']}")
-
-    doc.add_paragraph()  # space
-
-    # Table for services
-    doc.add_paragraph("Invoice Details", style='Heading 2')
-
-    table = doc.add_table(rows=1, cols=3)
-    table.style = 'Table Grid'
-    # Set custom column widths: Date, Description, Total
-    table.columns[0].width = Inches(1.0)
-    table.columns[1].width = Inches(4.0)
-    table.columns[2].width = Inches(1.0)
-    hdr_cells = table.rows[0].cells
-    hdr_cells[0].text = 'Date'
-    hdr_cells[1].text = 'Description of Service'
-    hdr_cells[2].text = 'Total'
-    hdr_cells[0].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-    hdr_cells[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.LEFT
-    hdr_cells[2].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    logger.debug("Created services table with headers")
-
-    # Add background color to header cells
-    light_green_color = "A9D08E"
-    for cell in hdr_cells:
-        tcPr = cell._tc.get_or_add_tcPr()
-        shd = OxmlElement('w:shd')
-        shd.set(qn('w:fill'), light_green_color)
-        shd.set(qn('w:val'), 'clear')
-        tcPr.append(shd)
-    logger.debug(f"Applied background color {light_green_color} to header cells")
+    logger.debug("Added invoice header with number %s and client %s", details['invoice_number'], details['client_name'])
 
+    # Services table
     # Process services and calculate costs
-    import re
-    subtotal = 0
-    logger.info(f"Processing {len(details['services'])} services and calculating costs")
+    services = details['services']
+    hourly_rate = details['hourly_rate']
+    logger.info("Processing %d services and calculating costs", len(services))
     
-    for service in details['services']:
-        row_cells = table.add_row().cells
-        
+    # First pass: parse every service and compute its cost
+    rows = []
+    for service in services:
         # Extract date from service description using regex
-        date_match = re.search(r'(\d{1,2}\.\d{1,2}\.\d{2,4})', service)
+        date_match = _DATE_RE.search(service)
         date_str = date_match.group(1) if date_match else ""
         
         # Extract hours from service description
-        hours_match = re.search(r'\((\d+\.?\d*)\s*hours?\)', service)
+        hours_match = _HOURS_RE.search(service)
         hours = float(hours_match.group(1)) if hours_match else 0
         
         # Create a clean description without the date
         description = service
         if date_match:
-            description = re.sub(r'\s*\d{1,2}\.\d{1,2}\.\d{2,4}\s*', ' ', description).strip()
+            description = _DATE_SUB_RE.sub(' ', description).strip()
+        
+        cost = hours * hourly_rate
+        rows.append((date_str, description, cost))
+        logger.debug("Service: %s - Date: %s - Hours: %s - Cost: £%.2f", service, date_str, hours, cost)
+    
+    subtotal = math.fsum(cost for _, _, cost in rows)
+    
+    # Second pass: add a table row per service
+    for date_str, description, cost in rows:
+        row_cells = table.add_row().cells
         
-        # Fill cells
         date_cell = row_cells[0]
         date_cell.text = date_str
         date_cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
         
-        desc_cell = row_cells[1]
-        desc_cell.text = description
+        row_cells[1].text = description
         
-        # Calculate cost
-        cost = hours * details['hourly_rate']
         row_cells[2].text = f'£{cost:.2f}'
         row_cells[2].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        
-        subtotal += cost
-        logger.info(f"Service: {service} - Date: {date_str} - Hours: {hours} - Cost: £{cost:.2f}")
 
-    logger.info(f"Subtotal calculated: £{subtotal:.2f}")
+    logger.info("Subtotal calculated: £%.2f", subtotal)
 
     # Totals
     row_subtotal = table.add_row().cells
@@ -620,7 +1111,7 @@ def generate_invoice_document(details: Dict, output_path: Path, generate_pdf: bo
     logger.debug("Added subtotal row")
 
     vat_amount = subtotal * (details['vat_rate'] / 100)
-    logger.info(f"VAT amount calculated ({details['vat_rate']}%): £{vat_amount:.2f}")
+    logger.info("VAT amount calculated (%s%%): £%.2f", details['vat_rate'], vat_amount)
 
     row_vat = table.add_row().cells
     row_vat[0].text = ''
@@ -628,10 +1119,10 @@ def generate_invoice_document(details: Dict, output_path: Path, generate_pdf: bo
     row_vat[1].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
     row_vat[2].text = f'£{vat_amount:.2f}'
     row_vat[2].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    logger.debug(f"Added VAT row with rate {details['vat_rate']}%")
+    logger.debug("Added VAT row with rate %s%%", details['vat_rate'])
 
     total = subtotal + vat_amount
-    logger.info(f"Total amount due: £{total:.2f}")
+    logger.info("Total amount due: £%.2f", total)
 
     row_total = table.add_row().cells
     # Make both cells of Total Amount Due bold
@@ -651,36 +1142,30 @@ def generate_invoice_document(details: Dict, output_path: Path, generate_pdf: bo
     total_amount_cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
     logger.debug("Added total amount due row with bold formatting")
 
-    doc.add_paragraph()  # space
-
     # Footer details
-    footer_text = (
-        f"Payment terms of within {details['payment_terms_days']} days.\n"
-        "Please make payment by direct transfer to:\n"
-        f"Bank Address: {details['bank_address']}\n"
-        f"Account name: {details['company_name']}\n"
-        f"Account Number: {details['account_number']}\n"
-        f"Sort Code: {details['sort_code']}\n"
-        "\n"
-        "Thanks for your business!\n"
-        "\n"
-        f"{details['company_name']}, Registered in the UK. Company Number: {details['company_number']}\n"
-        f"Registered office: {details['registered_address']}\n"
-        f"Registered for VAT in the UK. Registration number: {details['vat_number']}\n"
-        f"Email: {details['email']} | Contact: {details['contact_number']}"
-    )
-
-    footer_paragraph = doc.add_paragraph()
-    run = footer_paragraph.add_run(footer_text)
-    run.font.size = Pt(8)
+    footer_text = "\n".join([
+        f"Payment terms of within {details['payment_terms_days']} days.",
+        "Please make payment by direct transfer to:",
+        f"Bank Address: {details['bank_address']}",
+        f"Account name: {details['company_name']}",
+        f"Account Number: {details['account_number']}",
+        f"Sort Code: {details['sort_code']}",
+        "",
+        "Thanks for your business!",
+        "",
+        f"{details['company_name']}, Registered in the UK. Company Number: {details['company_number']}",
+        f"Registered office: {details['registered_address']}",
+        f"Registered for VAT in the UK. Registration number: {details['vat_number']}",
+        f"Email: {details['email']} | Contact: {details['contact_number']}",
+    ])
+
+    doc.paragraphs[-1].runs[0].text = footer_text
     logger.debug("Added footer with payment and company details")
 
     # Add PAID stamp as a watermark in the footer, bottom left, if paid
     if details.get('paid'):
         try:
-            import os
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            stamp_path = os.path.join(current_dir, 'paid_stamp.png')
+            stamp_path = PAID_STAMP_PATH
             if os.path.exists(stamp_path):
                 section = doc.sections[0]
                 footer = section.footer
@@ -690,32 +1175,93 @@ def generate_invoice_document(details: Dict, output_path: Path, generate_pdf: bo
                 # Add a new paragraph for the watermark
                 paragraph = footer.add_paragraph()
                 run = paragraph.add_run()
-                run.add_picture(stamp_path, width=Inches(1.5))
+                run.add_picture(stamp_path, width=_STAMP_WIDTH)
                 # Optionally, set paragraph spacing to 0
                 paragraph.paragraph_format.space_after = 0
                 paragraph.paragraph_format.space_before = 0
                 # The image will be in the footer, bottom left, and appear behind content
             else:
-                logger.warning(f"PAID stamp image not found at {stamp_path}")
+                logger.warning("PAID stamp image not found at %s", stamp_path)
         except Exception as e:
-            logger.error(f"Failed to add PAID watermark to footer: {e}")
+            logger.error("Failed to add PAID watermark to footer: %s", e)
 
     # Save the document
-    logger.info(f"Saving invoice document to: {output_path}")
+    logger.info("Saving invoice document to: %s", output_path)
     doc.save(output_path)
-    logger.info(f"Invoice document saved successfully")
+    logger.info("Invoice document saved successfully")
 
     # Return PDF path if requested
     if generate_pdf:
-        logger.info(f"Converting document to PDF format")
-        pdf_path = convert_to_pdf(output_path, logger)
-        logger.info(f"PDF conversion complete, output at: {pdf_path}")
+        logger.info("Converting document to PDF format")
+        if unoserver_port:
+            pdf_path = convert_with_unoserver(output_path, unoserver_port)
+        else:
+            pdf_path = convert_to_pdf(output_path, logger)
+        logger.info("PDF conversion complete, output at: %s", pdf_path)
         return pdf_path
     
     return output_path
 
+def convert_invoices_to_pdf(docx_paths: List[Path], unoserver_port: Optional[int] = None) -> List[Path]:
+    """
+    Convert several DOCX files, all in one directory, to PDF. Through a unoserver
+    each conversion is already warm; without one, all files go to a single
+    LibreOffice run so its start-up is paid once per batch rather than per invoice.
+    """
+    if unoserver_port:
+        return [convert_with_unoserver(docx_path, unoserver_port) for docx_path in docx_paths]
+    pdf_paths = [get_pdf_path(docx_path) for docx_path in docx_paths]
+    soffice = shutil.which('soffice') or shutil.which('libreoffice')
+    if soffice:
+        result = subprocess.run(
+            [soffice, '--headless', '--convert-to', 'pdf',
+             '--outdir', str(docx_paths[0].parent), *map(str, docx_paths)],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0 and all(pdf_path.exists() for pdf_path in pdf_paths):
+            return pdf_paths
+        logger.warning("Batch LibreOffice conversion failed (exit %d): %s", result.returncode, result.stderr.strip())
+    else:
+        logger.warning("soffice not found on PATH")
+    return [convert_to_pdf(docx_path, logger) for docx_path in docx_paths]
+
+def generate_invoice_batch(invoice_dicts: List[Dict], work_dir: Path,
+                           unoserver_port: Optional[int] = None) -> List[Path]:
+    """Build the DOCX for each invoice in work_dir, then convert them to PDF together."""
+    docx_paths = []
+    for index, details in enumerate(invoice_dicts):
+        # Prefix with the position so repeated invoice numbers cannot collide
+        docx_path = work_dir / f"{index}_invoice_{details['invoice_number']}.docx"
+        generate_invoice_document(details, docx_path)
+        docx_paths.append(docx_path)
+    return convert_invoices_to_pdf(docx_paths, unoserver_port)
+
+def build_zip_archive(entries: List[Tuple[str, Union[bytes, Path]]]) -> bytes:
+    """
+    Pack (filename, bytes or path) entries into a ZIP archive. DOCX and PDF are
+    already compressed, so entries are stored as-is; repeated names get a suffix.
+    """
+    buffer = io.BytesIO()
+    seen: Set[str] = set()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as archive:
+        for filename, content in entries:
+            name, counter = filename, 1
+            while name in seen:
+                counter += 1
+                stem, dot, ext = filename.rpartition('.')
+                name = f"{stem}_{counter}{dot}{ext}"
+            seen.add(name)
+            if isinstance(content, Path):
+                archive.write(content, name)
+            else:
+                archive.writestr(name, content)
+    return buffer.getvalue()
+
 @app.post("/generate-invoice", 
-    response_class=FileResponse,
+    response_class=Response,
+    response_model=None,
+    openapi_extra={"requestBody": _INVOICE_REQUEST_BODY},
     summary="Generate invoice document",
     description="""
 Generate an invoice in DOCX or PDF format based on the provided details.
@@ -768,9 +1314,9 @@ The date should be in DD.MM.YY format within the service description.
     }
 )
 async def generate_invoice(
-    invoice_details: InvoiceDetails,
+    invoice_details: InvoiceDetails = Depends(parse_invoice_details),
     format: OutputFormat = Query(OutputFormat.DOCX, description="Output format for the invoice")
-):
+) -> Response:
     """
     Generate an invoice based on the provided details.
     Returns the invoice file for download.
@@ -779,85 +1325,234 @@ async def generate_invoice(
     - **format**: Output format, either 'docx' or 'pdf' (default: 'docx')
     """
     try:
-        logger.info(f"Received request to generate invoice #{invoice_details.invoice_number} in {format} format")
-        logger.debug(f"Invoice details: {invoice_details.dict()}")
+        logger.info("Received request to generate invoice #%s in %s format", invoice_details.invoice_number, format.value)
+        invoice_dict = invoice_details.model_dump()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Invoice details: %s", orjson.dumps(invoice_dict).decode())
         
-        generate_pdf = format.lower() == "pdf"
+        generate_pdf = format is OutputFormat.PDF
+        media_type = MEDIA_TYPES[format]
+        filename = f"invoice_{invoice_details.invoice_number}.{format.value}"
+        loop = asyncio.get_running_loop()
         
-        # Create a temporary YAML file to store the invoice details
-        with tempfile.NamedTemporaryFile(suffix='.yaml', delete=False, mode='w') as temp_yaml:
-            # Convert the invoice details to a dictionary and include service_date and service_description
-            invoice_dict = invoice_details.dict()
-            if invoice_details.service_date:
-                invoice_dict['service_date'] = invoice_details.service_date
-            if invoice_details.service_description:
-                invoice_dict['service_description'] = invoice_details.service_description
-            yaml.dump(invoice_dict, temp_yaml)
-            temp_yaml_path = Path(temp_yaml.name)
-            logger.debug(f"Created temporary YAML file at: {temp_yaml_path}")
+        # Identical details always produce the same invoice, so reuse earlier results
+        cache_key = get_invoice_cache_key(invoice_dict)
         
-        try:
-            # Generate the output path for the invoice
-            invoice_path = get_output_path(temp_yaml_path)
-            logger.info(f"Output path for invoice: {invoice_path}")
-            
-            # Generate the invoice
-            result_path = generate_invoice_document(
-                invoice_dict, 
-                invoice_path, 
-                generate_pdf
-            )
-            
-            # If PDF was requested, get the PDF path
-            if generate_pdf:
-                result_path = get_pdf_path(invoice_path)
+        if not generate_pdf:
+            # DOCX output is built in memory and returned directly
+            content = get_cached_docx(cache_key)
+            if content is None:
+                buffer = io.BytesIO()
+                await loop.run_in_executor(app.state.executor, generate_invoice_document, invoice_dict, buffer)
+                content = buffer.getvalue()
+                store_cached_docx(cache_key, content)
+            else:
+                logger.info("Using cached invoice file for #%s", invoice_details.invoice_number)
+            logger.info("Returning invoice file: %s", filename)
+            return attachment_response(content, media_type, filename)
+        
+        cache_path = get_pdf_cache_path(cache_key)
+        if get_cached_pdf(cache_path):
+            logger.info("Returning cached invoice file: %s", cache_path)
+            return await file_attachment_response(cache_path, media_type, filename)
+        
+        # PDF conversion needs the DOCX on disk; use a scratch directory per request
+        # so concurrent requests never collide and nothing accumulates on disk
+        with tempfile.TemporaryDirectory(prefix='invoice_', dir=app.state.tmpdir) as tmp_name:
+            work_dir = Path(tmp_name)
+            invoice_path = work_dir / f"invoice_{invoice_details.invoice_number}.docx"
+            logger.info("Output path for invoice: %s", invoice_path)
             
-            logger.info(f"Returning invoice file: {result_path}")
+            # Bound concurrent conversions, then reserve an idle unoserver worker
+            ports = app.state.unoserver_ports
+            async with app.state.pdf_semaphore:
+                unoserver_port = await ports.get() if ports is not None else None
+                try:
+                    # Generate the invoice in the executor so the event loop keeps serving
+                    result_path = await loop.run_in_executor(
+                        app.state.executor,
+                        generate_invoice_document,
+                        invoice_dict, 
+                        invoice_path, 
+                        generate_pdf,
+                        unoserver_port
+                    )
+                finally:
+                    if unoserver_port is not None:
+                        ports.put_nowait(unoserver_port)
             
-            # Return the file as a response
-            return FileResponse(
-                path=result_path,
-                filename=f"invoice_{invoice_details.invoice_number}.{format.lower()}",
-                media_type=f"application/{'pdf' if format.lower() == 'pdf' else 'vnd.openxmlformats-officedocument.wordprocessingml.document'}"
-            )
+            await loop.run_in_executor(app.state.executor, store_cached_pdf, cache_path, result_path)
+        await loop.run_in_executor(app.state.executor, prune_pdf_cache)
         
-        finally:
-            # Clean up the temporary YAML file
-            if temp_yaml_path.exists():
-                os.unlink(temp_yaml_path)
-                logger.debug(f"Cleaned up temporary YAML file: {temp_yaml_path}")
+        # Stream the cached copy so a large PDF is never held in memory whole
+        logger.info("Returning invoice file: %s", cache_path)
+        return await file_attachment_response(cache_path, media_type, filename)
                 
     except Exception as e:
         error_msg = f"Error generating invoice: {str(e)}"
         logger.error(error_msg, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to generate invoice: {str(e)}")
 
+@app.post("/generate-invoices",
+    response_class=Response,
+    response_model=None,
+    openapi_extra={"requestBody": _INVOICE_BATCH_REQUEST_BODY},
+    summary="Generate several invoice documents",
+    description=f"""
+Generate up to {MAX_BATCH_INVOICES} invoices in DOCX or PDF format in one request and
+return them together as a ZIP archive.
+
+Each item in the request array has the same shape as the /generate-invoice body.
+Invoices generated before are served from the cache; for PDF output the remaining
+ones are converted together, so LibreOffice start-up is paid once per batch.
+    """,
+    response_description="A ZIP archive with one invoice file per item",
+    status_code=status.HTTP_200_OK,
+    tags=["Invoices"],
+    responses={
+        200: {
+            "content": {"application/zip": {}},
+            "description": "Return the generated invoices as a ZIP archive",
+        },
+        500: {
+            "description": "Internal server error",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Failed to generate invoices: Error message details"}
+                }
+            }
+        }
+    }
+)
+async def generate_invoices(
+    invoices: List[InvoiceDetails] = Depends(parse_invoice_batch),
+    format: OutputFormat = Query(OutputFormat.DOCX, description="Output format for the invoices")
+) -> Response:
+    """
+    Generate several invoices and return them as one ZIP download.
+    
+    - **invoices**: JSON array of invoice objects
+    - **format**: Output format, either 'docx' or 'pdf' (default: 'docx')
+    """
+    try:
+        logger.info("Received request to generate %d invoices in %s format", len(invoices), format.value)
+        invoice_dicts = [invoice.model_dump() for invoice in invoices]
+        cache_keys = [get_invoice_cache_key(details) for details in invoice_dicts]
+        filenames = [f"invoice_{details['invoice_number']}.{format.value}" for details in invoice_dicts]
+        loop = asyncio.get_running_loop()
+        
+        if format is OutputFormat.DOCX:
+            contents = [get_cached_docx(cache_key) for cache_key in cache_keys]
+            for index, content in enumerate(contents):
+                if content is None:
+                    buffer = io.BytesIO()
+                    await loop.run_in_executor(app.state.executor, generate_invoice_document, invoice_dicts[index], buffer)
+                    contents[index] = buffer.getvalue()
+                    store_cached_docx(cache_keys[index], contents[index])
+            entries = list(zip(filenames, contents))
+        else:
+            cache_paths = [get_pdf_cache_path(cache_key) for cache_key in cache_keys]
+            # Each distinct invoice missing from the cache is generated once
+            missing = {}
+            for details, cache_path in zip(invoice_dicts, cache_paths):
+                if not get_cached_pdf(cache_path):
+                    missing.setdefault(cache_path, details)
+            if missing:
+                logger.info("Generating %d of %d invoices; the rest are cached", len(missing), len(invoices))
+                with tempfile.TemporaryDirectory(prefix='invoices_', dir=app.state.tmpdir) as tmp_name:
+                    work_dir = Path(tmp_name)
+                    ports = app.state.unoserver_ports
+                    async with app.state.pdf_semaphore:
+                        unoserver_port = await ports.get() if ports is not None else None
+                        try:
+                            pdf_paths = await loop.run_in_executor(
+                                app.state.executor,
+                                generate_invoice_batch,
+                                list(missing.values()),
+                                work_dir,
+                                unoserver_port
+                            )
+                        finally:
+                            if unoserver_port is not None:
+                                ports.put_nowait(unoserver_port)
+                    for cache_path, pdf_path in zip(missing, pdf_paths):
+                        await loop.run_in_executor(app.state.executor, store_cached_pdf, cache_path, pdf_path)
+            entries = list(zip(filenames, cache_paths))
+        
+        archive = await loop.run_in_executor(app.state.executor, build_zip_archive, entries)
+        if format is OutputFormat.PDF and missing:
+            await loop.run_in_executor(app.state.executor, prune_pdf_cache)
+        logger.info("Returning %d invoices as a ZIP archive", len(entries))
+        return attachment_response(archive, "application/zip", "invoices.zip")
+                
+    except Exception as e:
+        error_msg = f"Error generating invoices: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to generate invoices: {str(e)}")
+
+class RootInfo(BaseModel):
+    """Response body of the API root endpoint"""
+    message: str
+    usage: str
+    documentation: str
+    version: str
+    verbose_logging: bool
+
+class VersionInfo(BaseModel):
+    """Response body of the version endpoint"""
+    api_name: str
+    version: str
+    cors_enabled: bool
+    cors_origins: List[str]
+    verbose_logging: bool
+
+# The root and version payloads only depend on configuration, so they are
+# serialized once at import and served as bytes
+_ROOT_INFO_JSON = RootInfo(
+    message="Invoice Generator API",
+    usage="POST /generate-invoice with required invoice details",
+    documentation="/docs for Swagger UI documentation",
+    version="1.0.0",
+    verbose_logging=VERBOSE,
+).model_dump_json().encode()
+
+_VERSION_INFO_JSON = VersionInfo(
+    api_name="Invoice Generator API",
+    version="1.0.0",
+    cors_enabled=True,
+    cors_origins=CORS_ORIGINS,
+    verbose_logging=VERBOSE,
+).model_dump_json().encode()
+
+# Clients may cache the system endpoints briefly and then revalidate with the ETag
+_SYSTEM_INFO_CACHE_CONTROL = "public, max-age=60"
+_ROOT_INFO_HEADERS = {"ETag": make_etag(_ROOT_INFO_JSON), "Cache-Control": _SYSTEM_INFO_CACHE_CONTROL}
+_VERSION_INFO_HEADERS = {"ETag": make_etag(_VERSION_INFO_JSON), "Cache-Control": _SYSTEM_INFO_CACHE_CONTROL}
+
 @app.get("/", 
     summary="API root endpoint",
     description="API root endpoint with basic information and usage instructions",
     tags=["System"],
+    response_model=RootInfo,
 )
-async def root():
+async def root(request: Request) -> Response:
     """API root endpoint with usage information."""
     logger.debug("Received request to root endpoint")
-    return {
-        "message": "Invoice Generator API",
-        "usage": "POST /generate-invoice with required invoice details",
-        "documentation": "/docs for Swagger UI documentation",
-        "version": "1.0.0",
-        "verbose_logging": VERBOSE
-    }
+    return conditional_response(request, _ROOT_INFO_JSON, "application/json", _ROOT_INFO_HEADERS)
 
-# Add middleware to log all requests
-@app.middleware("http")
+# Middleware to log all requests at debug level. Uvicorn's access log already
+# records every request, so this is only registered in verbose mode.
 async def log_requests(request, call_next):
-    logger.debug(f"Request: {request.method} {request.url}")
+    logger.debug("Request: %s %s", request.method, request.url)
     response = await call_next(request)
-    logger.debug(f"Response status: {response.status_code}")
+    logger.debug("Response status: %s", response.status_code)
     return response
 
+if VERBOSE:
+    app.middleware("http")(log_requests)
+
 
-# Custom OpenAPI schema generation
+# Custom OpenAPI schema generation, built once and cached on the app
 def custom_openapi():
     if app.openapi_schema:
         return app.openapi_schema
@@ -889,44 +1584,80 @@ This API allows you to generate professional invoices in DOCX and PDF formats.
 4. Total amount due = subtotal + VAT amount""",
         routes=app.routes,
     )
+    # The invoice body is parsed by a dependency, so its model is not collected automatically
+    invoice_schema = InvoiceDetails.model_json_schema(ref_template="#/components/schemas/{model}")
+    schemas = openapi_schema.setdefault("components", {}).setdefault("schemas", {})
+    schemas.update(invoice_schema.pop("$defs", {}))
+    schemas["InvoiceDetails"] = invoice_schema
     
-    # Add example values
     app.openapi_schema = openapi_schema
     return app.openapi_schema
 
 app.openapi = custom_openapi
 
+@lru_cache(maxsize=8)
+def openapi_json_bytes(root_path: str) -> bytes:
+    """
+    Serialize the OpenAPI schema once per root path, listing the root path as a
+    server the same way FastAPI's own /openapi.json route does.
+    """
+    schema = app.openapi()
+    if root_path and app.root_path_in_servers:
+        server_urls = {server.get("url") for server in schema.get("servers", [])}
+        if root_path not in server_urls:
+            schema = dict(schema, servers=[{"url": root_path}] + schema.get("servers", []))
+    return orjson.dumps(schema)
+
+@lru_cache(maxsize=8)
+def openapi_representations(root_path: str) -> Dict[str, Tuple[bytes, str]]:
+    """
+    The serialized OpenAPI schema for a root path, compressed once per content
+    coding, with each representation's body and ETag keyed by coding.
+    """
+    content = openapi_json_bytes(root_path)
+    encoded = {'identity': content, 'gzip': gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded['br'] = brotli.compress(content, quality=11)
+    return {coding: (body, make_etag(body)) for coding, body in encoded.items()}
+
+async def openapi_json(request: Request) -> Response:
+    """
+    Serve the pre-serialized OpenAPI schema, revalidated by ETag on every use.
+    It is sent pre-compressed, so GZipMiddleware never re-encodes a body under
+    the identity representation's ETag.
+    """
+    root_path = request.scope.get("root_path", "").rstrip("/")
+    representations = openapi_representations(root_path)
+    headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    content, etag = representations['identity']
+    accepted = accepted_encodings(request)
+    for coding in ('br', 'gzip'):
+        if coding in accepted and coding in representations:
+            content, etag = representations[coding]
+            headers["Content-Encoding"] = coding
+            break
+    headers["ETag"] = etag
+    return conditional_response(request, content, "application/json", headers)
+
+# Replace FastAPI's /openapi.json route, which re-encodes the schema dict on every hit
+app.router.routes[:] = [route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url]
+app.add_route(app.openapi_url, openapi_json, include_in_schema=False)
+
 # API version info endpoint - Useful for checking if API is running and checking CORS
 @app.get("/version",
     summary="API version information",
     description="Returns the current API version and configuration information",
-    tags=["System"]
+    tags=["System"],
+    response_model=VersionInfo,
 )
-async def version():
+async def version(request: Request) -> Response:
     """Return API version and configuration information."""
     logger.debug("Request received for API version information")
-    return {
-        "api_name": "Invoice Generator API",
-        "version": "1.0.0",
-        "cors_enabled": True,
-        "cors_origins": CORS_ORIGINS,
-        "verbose_logging": VERBOSE
-    }
+    return conditional_response(request, _VERSION_INFO_JSON, "application/json", _VERSION_INFO_HEADERS)
 
 # Example of how to use the API from a web page
-@app.get("/example-client",
-    summary="Example web client",
-    description="Returns a simple HTML page with JavaScript code to test the API",
-    tags=["Documentation"],
-    response_class=FileResponse
-)
-async def example_client():
-    """Serve a simple HTML page with JavaScript to test the API."""
-    logger.debug("Serving example client HTML page")
-    
-    # Create a temporary HTML file with the example code
-    with tempfile.NamedTemporaryFile(suffix='.html', delete=False, mode='w') as temp_html:
-        temp_html.write('''
+# HTML test client served by /example-client
+_EXAMPLE_CLIENT_HTML = '''
         <!DOCTYPE html>
         <html>
         <head>
@@ -1028,6 +1759,23 @@ const invoiceData = {
                             "icon_name": "DioramaConsultingIcon.png"
                         };
                         
+                        // Pick the target file while the click still counts as user
+                        // activation; a slow PDF would outlast it and the picker would
+                        // then throw SecurityError
+                        const filename = `invoice_1010.${format}`;
+                        let handle = null;
+                        if ('showSaveFilePicker' in window) {
+                            try {
+                                handle = await window.showSaveFilePicker({suggestedName: filename});
+                            } catch (error) {
+                                if (error.name === 'AbortError') {
+                                    resultDiv.innerHTML = '<p>Invoice generation cancelled.</p>';
+                                    return;
+                                }
+                                // Any other failure falls back to a regular download
+                            }
+                        }
+                        
                         // Direct file download approach (binary data)
                         const response = await fetch(`http://localhost:8083/generate-invoice?format=${format}`, {
                             method: 'POST',
@@ -1042,18 +1790,24 @@ const invoiceData = {
                             throw new Error(`API error: ${response.status} ${response.statusText}\\n${errorText}`);
                         }
                         
-                        // Get the blob from the response
-                        const blob = await response.blob();
-                        
-                        // Create a download link and click it
-                        const url = window.URL.createObjectURL(blob);
-                        const a = document.createElement('a');
-                        a.href = url;
-                        a.download = `invoice_1010.${format}`;
-                        document.body.appendChild(a);
-                        a.click();
-                        window.URL.revokeObjectURL(url);
-                        a.remove();
+                        if (handle) {
+                            // Stream the response straight to the chosen file
+                            const writable = await handle.createWritable();
+                            await response.body.pipeTo(writable);
+                        } else {
+                            // Get the blob from the response
+                            const blob = await response.blob();
+                            
+                            // Create a download link and click it
+                            const url = window.URL.createObjectURL(blob);
+                            const a = document.createElement('a');
+                            a.href = url;
+                            a.download = filename;
+                            document.body.appendChild(a);
+                            a.click();
+                            window.URL.revokeObjectURL(url);
+                            a.remove();
+                        }
                         
                         resultDiv.innerHTML = `<p>✅ ${format.toUpperCase()} invoice generated successfully! Check your downloads.</p>`;
                     } catch (error) {
@@ -1068,17 +1822,92 @@ const invoiceData = {
             </script>
         </body>
         </html>
-        ''')
-        temp_html_path = Path(temp_html.name)
-    
-    return FileResponse(
-        path=temp_html_path,
-        filename="invoice_api_example.html",
-        media_type="text/html"
-    )
+        '''
+
+def minify_html(html: str) -> str:
+    """
+    Strip indentation, blank lines and whole-line // comments from HTML with
+    inline scripts, leaving the contents of <pre> blocks untouched. Line breaks
+    are kept so JavaScript statement boundaries are unchanged.
+    """
+    lines = []
+    in_pre = False
+    for line in html.splitlines():
+        if in_pre:
+            lines.append(line)
+            in_pre = '</pre>' not in line
+            continue
+        stripped = line.strip()
+        if stripped and not stripped.startswith('//'):
+            lines.append(stripped)
+        in_pre = '<pre>' in stripped and '</pre>' not in stripped
+    return '\n'.join(lines)
+
+_EXAMPLE_CLIENT_HTML_BYTES = minify_html(_EXAMPLE_CLIENT_HTML).encode('utf-8')
+
+# The page never changes, so compress it once here rather than per request
+_EXAMPLE_CLIENT_HTML_ENCODED = {
+    'gzip': gzip.compress(_EXAMPLE_CLIENT_HTML_BYTES, compresslevel=9, mtime=0),
+}
+if brotli is not None:
+    _EXAMPLE_CLIENT_HTML_ENCODED['br'] = brotli.compress(_EXAMPLE_CLIENT_HTML_BYTES, quality=11)
+# Each encoding is a different representation, so each gets its own ETag
+_EXAMPLE_CLIENT_ETAGS = {
+    coding: make_etag(content)
+    for coding, content in [('identity', _EXAMPLE_CLIENT_HTML_BYTES), *_EXAMPLE_CLIENT_HTML_ENCODED.items()]
+}
+
+def accepted_encodings(request: Request) -> Set[str]:
+    """Get the content codings the client accepts, ignoring those with q=0."""
+    encodings = set()
+    for item in request.headers.get('accept-encoding', '').split(','):
+        coding, _, params = item.partition(';')
+        if params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            encodings.add(coding.strip().lower())
+    return encodings
+
+@app.get("/example-client",
+    summary="Example web client",
+    description="Returns a simple HTML page with JavaScript code to test the API",
+    tags=["Documentation"],
+    response_class=HTMLResponse
+)
+async def example_client(request: Request):
+    """Serve a simple HTML page with JavaScript to test the API."""
+    logger.debug("Serving example client HTML page")
+    headers = {
+        "Content-Disposition": 'attachment; filename="invoice_api_example.html"',
+        "Cache-Control": "public, max-age=3600",
+        "Vary": "Accept-Encoding",
+    }
+    content = _EXAMPLE_CLIENT_HTML_BYTES
+    etag = _EXAMPLE_CLIENT_ETAGS['identity']
+    accepted = accepted_encodings(request)
+    for coding in ('br', 'gzip'):
+        if coding in accepted and coding in _EXAMPLE_CLIENT_HTML_ENCODED:
+            content = _EXAMPLE_CLIENT_HTML_ENCODED[coding]
+            etag = _EXAMPLE_CLIENT_ETAGS[coding]
+            headers["Content-Encoding"] = coding
+            break
+    headers["ETag"] = etag
+    return conditional_response(request, content, "text/html", headers)
 
 if __name__ == "__main__":
     import uvicorn # type: ignore
     
-    logger.info(f"Starting uvicorn server with VERBOSE={VERBOSE}")
-    uvicorn.run(app, host="0.0.0.0", port=8083) 
\ No newline at end of file
+    workers = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1))
+    # Workers re-import this module, so pass the count on for sizing their unoserver pools
+    os.environ['WEB_CONCURRENCY'] = str(workers)
+    logger.info(f"Starting uvicorn server with VERBOSE={VERBOSE} and {workers} worker(s)")
+    # Workers are separate processes, so uvicorn needs the app as an import string
+    uvicorn.run(
+        "invoice_generator_api:app",
+        host="0.0.0.0",
+        port=8083,
+        # uvloop does not support Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=workers,
+        log_level="info" if VERBOSE else "warning",
+        access_log=VERBOSE,
+    ) 
\ No newline at end of file
@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# The API creates its invoices directory relative to the working directory on
+# import, so keep test runs out of the source tree
+os.chdir(tempfile.mkdtemp(prefix='invoice_tests_'))
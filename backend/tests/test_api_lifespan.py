@@ -0,0 +1,11 @@
+from fastapi.testclient import TestClient
+
+import invoice_generator_api as api
+
+
+def test_app_serves_requests_after_a_restart():
+    example = api.InvoiceDetails.model_config["json_schema_extra"]["example"]
+    for invoice_number in ("1001", "1002"):
+        with TestClient(api.app) as client:
+            response = client.post("/generate-invoice", json={**example, "invoice_number": invoice_number})
+            assert response.status_code == 200, response.text
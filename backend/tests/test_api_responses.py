@@ -0,0 +1,42 @@
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import invoice_generator_api as api
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(api.app) as client:
+        yield client
+
+
+def test_openapi_etag_is_per_content_coding(client):
+    plain = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    gzipped = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in plain.headers
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in plain.headers["Vary"]
+    assert "Accept-Encoding" in gzipped.headers["Vary"]
+    assert plain.headers["ETag"] != gzipped.headers["ETag"]
+    assert orjson.loads(gzipped.content) == orjson.loads(plain.content)
+
+    revalidated = client.get("/openapi.json", headers={
+        "Accept-Encoding": "gzip", "If-None-Match": gzipped.headers["ETag"]})
+    assert revalidated.status_code == 304
+
+
+def test_downloads_are_sent_without_a_content_coding(client):
+    example = api.InvoiceDetails.model_config["json_schema_extra"]["example"]
+    for path, body in (("/generate-invoice", example), ("/generate-invoices", [example])):
+        response = client.post(path, json=body, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200, response.text
+        assert "Content-Encoding" not in response.headers
+
+
+def test_validation_errors_are_located_in_the_body(client):
+    example = api.InvoiceDetails.model_config["json_schema_extra"]["example"]
+    response = client.post("/generate-invoice", json={**example, "services": [{"bad": "entry"}]})
+    assert response.status_code == 422
+    assert [err["loc"] for err in response.json()["detail"]] == [["body", "services", 0]]
@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+import invoice_generator
+
+
+@pytest.mark.parametrize("service, expected", [
+    ("AI Consultancy (1 hour)", 1.0),
+    ("Notes write up (2.5 hours)", 2.5),
+    ("X (2 hours) remote", 2.0),
+    ("No hours given", 0.0),
+    ("Weird (2. hours)", 0.0),
+])
+def test_parse_service_hours(service, expected):
+    hours = invoice_generator.parse_service_hours(service)
+    assert hours == expected and isinstance(hours, float)
+
+
+@pytest.mark.parametrize("service", [
+    'a' + ' ' * 4000 + 'b',
+    '(' + '1' * 50000,
+    'x' + ' (1' * 20000,
+    '(' + '1.' * 20000,
+])
+def test_parse_service_hours_is_linear(service):
+    start = time.perf_counter()
+    invoice_generator.parse_service_hours(service)
+    assert time.perf_counter() - start < 1
+
+
+def test_batch_workers_never_start_their_own_listener(monkeypatch):
+    monkeypatch.setattr(invoice_generator, '_soffice_owner', True)
+    monkeypatch.setattr(invoice_generator, 'setup_logging', lambda verbose: None)
+    invoice_generator._init_batch_worker(False)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("worker started a LibreOffice listener")
+
+    monkeypatch.setattr(invoice_generator.subprocess, 'Popen', fail)
+    assert invoice_generator.start_soffice_listener('soffice', invoice_generator._log) is None
+
+
+def test_setup_logging_defers_to_configured_handlers(monkeypatch):
+    root = invoice_generator.logging.getLogger()
+    monkeypatch.setattr(root, 'handlers', [invoice_generator.logging.NullHandler()])
+    monkeypatch.setattr(invoice_generator, '_log_handler', None)
+    invoice_generator.setup_logging(True)
+
+    assert invoice_generator._log_handler is None
+    assert invoice_generator._log.handlers == []
+    assert invoice_generator._log.propagate
@@ -0,0 +1,32 @@
+import os
+import time
+
+import invoice_generator_api as api
+
+
+def test_cache_key_follows_icon_file(tmp_path):
+    icon = tmp_path / "icon.png"
+    icon.write_bytes(b"old")
+    details = {"invoice_number": "1", "icon_name": str(icon)}
+    before = api.get_invoice_cache_key(details)
+    assert api.get_invoice_cache_key(details) == before
+
+    icon.write_bytes(b"newer")
+    assert api.get_invoice_cache_key(details) != before
+
+
+def test_prune_removes_stale_then_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(api, "pdf_cache_dir", tmp_path)
+    monkeypatch.setattr(api, "PDF_CACHE_MAX_MB", 1)
+    monkeypatch.setattr(api, "PDF_CACHE_MAX_DAYS", 1)
+    now = time.time()
+    ages = {"stale.pdf": 2 * 86400, "old.pdf": 300, "recent.pdf": 200, "new.pdf": 100}
+    for name, age in ages.items():
+        path = tmp_path / name
+        path.write_bytes(b"x" * 400 * 1024)
+        os.utime(path, (now - age, now - age))
+
+    api.get_cached_pdf(tmp_path / "old.pdf")  # served just now
+    api.prune_pdf_cache()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["new.pdf", "old.pdf"]
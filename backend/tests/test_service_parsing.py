@@ -0,0 +1,59 @@
+import time
+
+import pytest
+from pydantic import ValidationError
+
+import invoice_generator_api as api
+
+# Long enough that quadratic backtracking takes seconds, while linear scans take milliseconds
+PATHOLOGICAL_SERVICES = [
+    '1.1.25 ' * 14000,                      # many dates, no hours
+    '(' + '1' * 50000,                      # a long digit run after '('
+    'a' + ' ' * 50000 + 'b 1.1.25 (1 hour)',  # a long whitespace run before a date
+]
+
+
+def _invoice(services):
+    return {
+        "client_name": "Mike Smith",
+        "client_address": "17 Poland St.",
+        "services": services,
+        "payment_terms_days": 30,
+        "invoice_number": 1,
+        "company_name": "Fizzbuzz Consulting Ltd",
+        "hourly_rate": 300,
+        "account_number": "12345678",
+        "sort_code": "12-34-56",
+        "bank_address": "123 Bank St",
+        "company_number": "12345678",
+        "vat_number": "GB1",
+        "registered_address": "123 Business St",
+        "email": "a@b.com",
+        "contact_number": "0770",
+    }
+
+
+@pytest.mark.parametrize("service", PATHOLOGICAL_SERVICES)
+def test_service_validation_is_linear(service):
+    start = time.perf_counter()
+    try:
+        api.InvoiceDetails.model_validate(_invoice([service]))
+    except ValidationError:
+        pass
+    assert time.perf_counter() - start < 1
+
+
+@pytest.mark.parametrize("service", PATHOLOGICAL_SERVICES)
+def test_service_line_parsing_is_linear(service):
+    start = time.perf_counter()
+    api._DATE_RE.search(service)
+    api._HOURS_RE.search(service)
+    api._DATE_SUB_RE.sub(' ', service)
+    assert time.perf_counter() - start < 1
+
+
+def test_service_line_parsing():
+    service = "AI Consultancy 29.03.25 (1.5 hours)"
+    assert api._DATE_RE.search(service).group(1) == "29.03.25"
+    assert api._HOURS_RE.search(service).group(1) == "1.5"
+    assert api._DATE_SUB_RE.sub(' ', service).strip() == "AI Consultancy (1.5 hours)"
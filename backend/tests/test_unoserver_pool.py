@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+import invoice_generator_api as api
+
+
+def test_free_ports_are_distinct():
+    ports = api._free_ports(20)
+    assert len(set(ports)) == 20
+
+
+def test_stop_unoservers_removes_profiles(tmp_path):
+    profile = tmp_path / "uno_profile_0"
+    (profile / "user").mkdir(parents=True)
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)",
+                             "--user-installation", profile.as_uri()])
+    api.stop_unoservers([proc])
+
+    assert proc.poll() is not None
+    assert not profile.exists()